@@ -26,7 +26,8 @@ from jira_ado_traceability.config import load_config_from_file
 from jira_ado_traceability.excel_generator import generate_excel_report
 from jira_ado_traceability.fuzzy_matcher import find_fuzzy_matches
 from jira_ado_traceability.jira_parser import load_and_parse_jira_issues
-from jira_ado_traceability.reporter import generate_summary_statistics, print_summary
+from jira_ado_traceability.models import NOT_LINKED
+from jira_ado_traceability.reporter import generate_summary_statistics, print_summary, summary_to_dict
 
 
 def parse_args() -> argparse.Namespace:
@@ -78,7 +79,7 @@ def main() -> int:
         # Fetch ADO work items for linked issues
         print("\nFetching Azure DevOps work items...")
         ado_client = AdoClient(config)
-        ado_ids = df[df["ADO ID"] != "Not Linked"]["ADO ID"].unique().tolist()
+        ado_ids = df[df["ADO ID"] != NOT_LINKED]["ADO ID"].unique().tolist()
         print(f"Found {len(ado_ids)} unique ADO work items to fetch")
         ado_work_items = ado_client.fetch_work_items(ado_ids)
 
@@ -87,7 +88,7 @@ def main() -> int:
         print("Fetching all ADO work items for fuzzy matching...")
         all_ado_work_items = ado_client.query_recent_work_items(days=config.ado_scan_days)
 
-        unlinked_df = df[df["ADO ID"] == "Not Linked"]
+        unlinked_df = df[df["ADO ID"] == NOT_LINKED]
         fuzzy_matches = find_fuzzy_matches(
             unlinked_df,
             all_ado_work_items,
@@ -107,7 +108,7 @@ def main() -> int:
         generate_excel_report(output_file, df, summary_df, fuzzy_matches)
 
         # Print summary
-        print_summary(df, len(fuzzy_matches), str(output_file))
+        print_summary(summary_to_dict(summary_df), len(fuzzy_matches), str(output_file))
 
         print()
         print("=" * 70)
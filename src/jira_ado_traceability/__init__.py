@@ -4,4 +4,8 @@ A comprehensive Python tool for generating traceability reports between
 Jira issues and Azure DevOps work items with intelligent fuzzy matching.
 """
 
+from jira_ado_traceability.models import AdoWorkItem, Config, FuzzyMatch, JiraIssue
+
 __version__ = "1.0.0"
+
+__all__ = ["AdoWorkItem", "Config", "FuzzyMatch", "JiraIssue", "__version__"]
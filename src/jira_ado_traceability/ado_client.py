@@ -1,11 +1,38 @@
 """Azure DevOps API client for fetching work items."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched
 from typing import Any
 
 import requests
 from requests.auth import HTTPBasicAuth
 
-from jira_ado_traceability.models import AdoWorkItem, Config
+from jira_ado_traceability.models import NOT_LINKED, AdoWorkItem, Config
+
+# Upper bound on simultaneous work item requests sent to ADO
+_MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum number of IDs the workitemsbatch endpoint accepts per request
+_BATCH_SIZE = 200
+
+# Fields read by _parse_work_item
+_WORK_ITEM_FIELDS = [
+    "System.Title",
+    "System.State",
+    "System.AssignedTo",
+    "System.WorkItemType",
+    "Microsoft.VSTS.Common.Priority",
+    "Microsoft.VSTS.Common.Severity",
+    "System.CreatedDate",
+    "Microsoft.VSTS.Common.ClosedDate",
+    "Microsoft.VSTS.Common.ResolvedDate",
+    "System.AreaPath",
+    "System.IterationPath",
+]
+
+# Fields needed for fuzzy matching
+_FUZZY_FIELDS = ["System.Title", "System.State", "System.WorkItemType"]
 
 
 class AdoClient:
@@ -28,7 +55,7 @@ class AdoClient:
             work_item_id: ADO work item ID
 
         Returns:
-            AdoWorkItem dictionary or None if fetch fails
+            AdoWorkItem or None if fetch fails
         """
         try:
             url = f"{self.api_base}/wit/workitems/{work_item_id}?api-version=5.0"
@@ -67,9 +94,9 @@ class AdoClient:
         return AdoWorkItem(
             id=str(work_item.get("id", "")),
             title=str(fields.get("System.Title", "")),
-            state=str(fields.get("System.State", "")),
+            state=sys.intern(str(fields.get("System.State", ""))),
             assigned_to=assigned_to,
-            work_item_type=str(fields.get("System.WorkItemType", "")),
+            work_item_type=sys.intern(str(fields.get("System.WorkItemType", ""))),
             priority=str(fields.get("Microsoft.VSTS.Common.Priority", "")),
             severity=str(fields.get("Microsoft.VSTS.Common.Severity", "")),
             created_date=str(fields.get("System.CreatedDate", "")),
@@ -79,6 +106,49 @@ class AdoClient:
             iteration_path=str(fields.get("System.IterationPath", "")),
         )
 
+    def _fetch_batch(self, work_item_ids: tuple[str, ...], fields: list[str]) -> list[dict[str, Any]]:
+        """Fetch up to _BATCH_SIZE work items in one workitemsbatch request.
+
+        Args:
+            work_item_ids: Numeric work item IDs
+            fields: Work item fields to return
+
+        Returns:
+            Raw work item JSON objects; IDs that don't exist or failed to fetch are left out
+        """
+        body = {"ids": [int(wid) for wid in work_item_ids], "fields": fields, "errorPolicy": "omit"}
+        try:
+            url = f"{self.api_base}/wit/workitemsbatch?api-version=5.0"
+            response = requests.post(url, auth=self.auth, json=body, timeout=30)
+        except requests.RequestException as e:
+            print(f"  [ERROR] Error fetching {len(work_item_ids)} ADO work items: {e!s}")
+            return []
+
+        if response.status_code != 200:
+            print(f"  [FAIL] Failed to fetch {len(work_item_ids)} ADO work items: HTTP {response.status_code}")
+            return []
+
+        # With errorPolicy "omit", missing or inaccessible items come back as null entries
+        return [work_item for work_item in response.json().get("value", []) if work_item]
+
+    def _fetch_batches(self, work_item_ids: list[str], fields: list[str]) -> list[dict[str, Any]]:
+        """Fetch work items in batches of _BATCH_SIZE, sending the batches concurrently.
+
+        Args:
+            work_item_ids: Numeric work item IDs
+            fields: Work item fields to return
+
+        Returns:
+            Raw work item JSON objects in request order
+        """
+        batches = list(batched(work_item_ids, _BATCH_SIZE, strict=False))
+        if not batches:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(batches))) as executor:
+            results = executor.map(lambda batch: self._fetch_batch(batch, fields), batches)
+            return [work_item for batch_items in results for work_item in batch_items]
+
     def fetch_work_items(self, work_item_ids: list[str]) -> dict[str, AdoWorkItem]:
         """Fetch multiple work items from ADO.
 
@@ -88,18 +158,27 @@ class AdoClient:
         Returns:
             Dictionary mapping work item IDs to AdoWorkItem objects
         """
-        work_items = {}
+        # Skip blanks and placeholders, and fetch each ID only once
+        ids: list[str] = []
+        for work_item_id in dict.fromkeys(wid for wid in work_item_ids if wid and wid != NOT_LINKED):
+            if work_item_id.isdigit():
+                ids.append(work_item_id)
+            else:
+                print(f"  [FAIL] Skipping ADO-{work_item_id}: not a numeric work item ID")
 
-        for work_item_id in work_item_ids:
-            if not work_item_id or work_item_id == "Not Linked":
-                continue
+        print(f"Fetching {len(ids)} ADO work items...")
 
-            print(f"Fetching ADO work item {work_item_id}...")
-            item = self.fetch_work_item(work_item_id)
+        # ADO echoes IDs back as integers, so "0123" comes back as 123; map each to the IDs as requested
+        requested: dict[int, list[str]] = {}
+        for work_item_id in ids:
+            requested.setdefault(int(work_item_id), []).append(work_item_id)
 
-            if item:
+        work_items: dict[str, AdoWorkItem] = {}
+        for raw_item in self._fetch_batches([str(number) for number in requested], _WORK_ITEM_FIELDS):
+            item = self._parse_work_item(raw_item)
+            for work_item_id in requested.get(raw_item.get("id", -1), []):
                 work_items[work_item_id] = item
-                print(f"  [OK] Successfully fetched ADO-{work_item_id}: {item['state']}")
+                print(f"  [OK] Successfully fetched ADO-{work_item_id}: {item.state}")
 
         return work_items
 
@@ -158,23 +237,15 @@ class AdoClient:
         """
         work_items: list[dict[str, Any]] = []
 
-        for work_item_id in work_item_ids:
-            try:
-                url = f"{self.api_base}/wit/workitems/{work_item_id}?api-version=5.0"
-                response = requests.get(url, auth=self.auth, timeout=10)
-
-                if response.status_code == 200:
-                    work_item = response.json()
-                    fields: dict[str, Any] = work_item.get("fields", {})
-                    work_item_dict: dict[str, Any] = {
-                        "id": work_item_id,
-                        "title": str(fields.get("System.Title", "")),
-                        "state": str(fields.get("System.State", "")),
-                        "work_item_type": str(fields.get("System.WorkItemType", "")),
-                    }
-                    work_items.append(work_item_dict)
-            except requests.RequestException as e:
-                print(f"  [WARN] Skipping work item {work_item_id}: {e!s}")
-                continue
+        for work_item in self._fetch_batches(work_item_ids, _FUZZY_FIELDS):
+            fields: dict[str, Any] = work_item.get("fields", {})
+            work_items.append(
+                {
+                    "id": str(work_item.get("id", "")),
+                    "title": str(fields.get("System.Title", "")),
+                    "state": sys.intern(str(fields.get("System.State", ""))),
+                    "work_item_type": sys.intern(str(fields.get("System.WorkItemType", ""))),
+                }
+            )
 
         return work_items
@@ -7,7 +7,8 @@ from jira_ado_traceability.excel_generator import generate_excel_report
 from jira_ado_traceability.fuzzy_matcher import find_fuzzy_matches
 from jira_ado_traceability.jira_client import fetch_jira_issues_from_api
 from jira_ado_traceability.jira_parser import load_and_parse_jira_issues, parse_jira_issues
-from jira_ado_traceability.reporter import generate_summary_statistics, print_summary
+from jira_ado_traceability.models import NOT_LINKED
+from jira_ado_traceability.reporter import generate_summary_statistics, print_summary, summary_to_dict
 
 
 def main() -> None:
@@ -47,7 +48,7 @@ def main() -> None:
     # Fetch ADO work items for linked issues
     print("\nFetching Azure DevOps work items...")
     ado_client = AdoClient(config)
-    ado_ids = df[df["ADO ID"] != "Not Linked"]["ADO ID"].unique().tolist()
+    ado_ids = df[df["ADO ID"] != NOT_LINKED]["ADO ID"].unique().tolist()
     print(f"Found {len(ado_ids)} unique ADO work items to fetch")
     ado_work_items = ado_client.fetch_work_items(ado_ids)
 
@@ -56,7 +57,7 @@ def main() -> None:
     print("Fetching all ADO work items for fuzzy matching...")
     all_ado_work_items = ado_client.query_recent_work_items(days=config.ado_scan_days)
 
-    unlinked_df = df[df["ADO ID"] == "Not Linked"]
+    unlinked_df = df[df["ADO ID"] == NOT_LINKED]
     fuzzy_matches = find_fuzzy_matches(
         unlinked_df,
         all_ado_work_items,
@@ -76,7 +77,11 @@ def main() -> None:
     actual_output_file = generate_excel_report(config.output_file, df, summary_df, fuzzy_matches)
 
     # Print summary
-    print_summary(df, len(fuzzy_matches), str(actual_output_file))
+    print_summary(
+        summary_to_dict(summary_df),
+        len(fuzzy_matches),
+        str(actual_output_file),
+    )
 
 
 if __name__ == "__main__":
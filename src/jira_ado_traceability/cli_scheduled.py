@@ -13,8 +13,8 @@ from jira_ado_traceability.excel_generator import generate_excel_report
 from jira_ado_traceability.fuzzy_matcher import find_fuzzy_matches
 from jira_ado_traceability.jira_client import fetch_jira_issues_from_api
 from jira_ado_traceability.jira_parser import load_and_parse_jira_issues, parse_jira_issues
-from jira_ado_traceability.models import AdoWorkItem, FuzzyMatch
-from jira_ado_traceability.reporter import generate_summary_statistics, print_summary
+from jira_ado_traceability.models import NOT_LINKED, AdoWorkItem, FuzzyMatch
+from jira_ado_traceability.reporter import generate_summary_statistics, print_summary, summary_to_dict
 
 
 def parse_args() -> argparse.Namespace:
@@ -67,7 +67,7 @@ def _fetch_ado_work_items(df: pd.DataFrame, ado_client: AdoClient) -> dict[str,
         Dictionary of ADO work items by ID
     """
     print("\nFetching Azure DevOps work items...")
-    ado_ids = df[df["ADO ID"] != "Not Linked"]["ADO ID"].unique().tolist()
+    ado_ids = df[df["ADO ID"] != NOT_LINKED]["ADO ID"].unique().tolist()
     print(f"Found {len(ado_ids)} unique ADO work items to fetch")
     return ado_client.fetch_work_items(ado_ids)
 
@@ -87,7 +87,7 @@ def _perform_fuzzy_matching(df: pd.DataFrame, ado_client: AdoClient, config: Con
     print("Fetching all ADO work items for fuzzy matching...")
     all_ado_work_items = ado_client.query_recent_work_items(days=config.ado_scan_days)
 
-    unlinked_df = df[df["ADO ID"] == "Not Linked"]
+    unlinked_df = df[df["ADO ID"] == NOT_LINKED]
     return find_fuzzy_matches(
         unlinked_df,
         all_ado_work_items,
@@ -138,7 +138,11 @@ def main() -> int:
         summary_df = generate_summary_statistics(df)
 
         actual_output_file = generate_excel_report(output_file, df, summary_df, fuzzy_matches)
-        print_summary(df, len(fuzzy_matches), str(actual_output_file))
+        print_summary(
+            summary_to_dict(summary_df),
+            len(fuzzy_matches),
+            str(actual_output_file),
+        )
 
     except FileNotFoundError as e:
         print(f"\nERROR: {e}")
@@ -1,8 +1,33 @@
 """Comparison functions for Jira and ADO data."""
 
+from collections.abc import Callable
+
 import pandas as pd
 
-from jira_ado_traceability.models import AdoWorkItem
+from jira_ado_traceability.models import (
+    ASSIGNEE_DIFFERENT,
+    NO_ADO_LINK,
+    NOT_APPLICABLE,
+    RESULT_MATCH,
+    STATUS_ADO_CLOSED,
+    STATUS_BOTH_CLOSED,
+    STATUS_BOTH_OPEN,
+    STATUS_JIRA_CLOSED,
+    WARN_PREFIX,
+    AdoWorkItem,
+)
+
+# Every result compare_status and compare_assignee can return, [OK] results first
+_STATUS_RESULTS = pd.CategoricalDtype(
+    [
+        STATUS_BOTH_CLOSED,
+        STATUS_BOTH_OPEN,
+        STATUS_JIRA_CLOSED,
+        STATUS_ADO_CLOSED,
+        NO_ADO_LINK,
+    ]
+)
+_ASSIGNEE_RESULTS = pd.CategoricalDtype([RESULT_MATCH, ASSIGNEE_DIFFERENT])
 
 
 def compare_status(jira_status_category: str, ado_state: str) -> str:
@@ -16,19 +41,19 @@ def compare_status(jira_status_category: str, ado_state: str) -> str:
         Comparison result string
     """
     if not ado_state or ado_state == "":
-        return "No ADO Link"
+        return NO_ADO_LINK
 
     # Normalize states
     jira_done = jira_status_category.lower() == "done"
     ado_closed = ado_state.lower() in ["closed", "resolved", "done", "removed"]
 
     if jira_done and ado_closed:
-        return "[OK] Both Closed"
+        return STATUS_BOTH_CLOSED
     if not jira_done and not ado_closed:
-        return "[OK] Both Open"
+        return STATUS_BOTH_OPEN
     if jira_done and not ado_closed:
-        return "[WARN] Jira Closed, ADO Open"
-    return "[WARN] ADO Closed, Jira Open"
+        return STATUS_JIRA_CLOSED
+    return STATUS_ADO_CLOSED
 
 
 def compare_severity(jira_severity: str, ado_severity: str) -> str:
@@ -42,15 +67,15 @@ def compare_severity(jira_severity: str, ado_severity: str) -> str:
         Comparison result string
     """
     if not ado_severity or ado_severity == "":
-        return "N/A"
+        return NOT_APPLICABLE
 
     # Extract numbers from severity strings (e.g., "Sev-4" -> "4")
     jira_num = "".join(filter(str.isdigit, str(jira_severity)))
     ado_num = str(ado_severity).strip()
 
     if jira_num == ado_num:
-        return "[OK] Match"
-    return f"[WARN] Mismatch (J:{jira_severity} vs A:{ado_severity})"
+        return RESULT_MATCH
+    return f"{WARN_PREFIX} Mismatch (J:{jira_severity} vs A:{ado_severity})"
 
 
 def compare_assignee(jira_assignee: str, ado_assignee: str) -> str:
@@ -64,8 +89,8 @@ def compare_assignee(jira_assignee: str, ado_assignee: str) -> str:
         Comparison result string
     """
     if jira_assignee.lower() == ado_assignee.lower():
-        return "[OK] Match"
-    return "[WARN] Different"
+        return RESULT_MATCH
+    return ASSIGNEE_DIFFERENT
 
 
 def _get_ado_field_mapping() -> dict[str, str]:
@@ -101,21 +126,50 @@ def _populate_ado_data(df: pd.DataFrame, ado_work_items: dict[str, AdoWorkItem])
     """
     ado_field_mapping = _get_ado_field_mapping()
 
-    for col in ado_field_mapping:
-        df[col] = ""
-
-    for idx, row in df.iterrows():
-        ado_id = str(row["ADO ID"])
-        if ado_id in ado_work_items:
-            work_item = ado_work_items[ado_id]
-            for col, field in ado_field_mapping.items():
-                # Get field value from TypedDict with proper typing
-                field_value: str = work_item.get(field, "")  # type: ignore[misc]
-                df.loc[idx, col] = field_value  # type: ignore[call-overload]
+    # Look each row's work item up once, then build every column from the same list
+    linked_items = [ado_work_items.get(ado_id) for ado_id in df["ADO ID"].astype(str)]
+    for col, field in ado_field_mapping.items():
+        values = [getattr(item, field) if item is not None else "" for item in linked_items]
+        df[col] = pd.Series(values, index=df.index, dtype=object)
 
     return df
 
 
+def _compare_pairs(
+    left: pd.Series,
+    right: pd.Series,
+    compare: Callable[[str, str], str],
+    dtype: pd.CategoricalDtype | None = None,
+) -> pd.Categorical:
+    """Apply a comparison to two columns, evaluating it once per distinct value pair.
+
+    Args:
+        left: First argument column
+        right: Second argument column
+        compare: Scalar comparison function
+        dtype: Result categories; inferred from the results if omitted
+
+    Returns:
+        Categorical of comparison results, one per row
+    """
+    left_codes, left_uniques = pd.factorize(left.astype(str))
+    right_codes, right_uniques = pd.factorize(right.astype(str))
+    left_values: list[str] = left_uniques.tolist()
+    right_values: list[str] = right_uniques.tolist()
+    width = len(right_values)
+
+    # Encode each (left, right) pair as one integer and keep the distinct pairs
+    pair_codes, pair_ids = pd.factorize(left_codes * width + right_codes)
+    results = pd.Index(
+        [compare(left_values[pair // width], right_values[pair % width]) for pair in pair_ids.tolist()],
+        dtype=object,
+    )
+
+    if dtype is None:
+        dtype = pd.CategoricalDtype(sorted(set(results)))
+    return pd.Categorical.from_codes(dtype.categories.get_indexer(results)[pair_codes], dtype=dtype)
+
+
 def add_comparison_columns(
     df: pd.DataFrame,
     ado_work_items: dict[str, AdoWorkItem],
@@ -131,14 +185,13 @@ def add_comparison_columns(
     """
     df = _populate_ado_data(df, ado_work_items)
 
-    df["Status Comparison"] = df.apply(
-        lambda row: compare_status(str(row["Jira Status Category"]), str(row["ADO State"])), axis=1
-    )
-    df["Severity Comparison"] = df.apply(
-        lambda row: compare_severity(str(row["Jira Severity"]), str(row["ADO Severity"])), axis=1
+    # Comparison results repeat a handful of strings, so store them as categorical codes
+    df["Status Comparison"] = _compare_pairs(
+        df["Jira Status Category"], df["ADO State"], compare_status, _STATUS_RESULTS
     )
-    df["Assignee Match"] = df.apply(
-        lambda row: compare_assignee(str(row["Jira Assignee"]), str(row["ADO Assigned To"])), axis=1
+    df["Severity Comparison"] = _compare_pairs(df["Jira Severity"], df["ADO Severity"], compare_severity)
+    df["Assignee Match"] = _compare_pairs(
+        df["Jira Assignee"], df["ADO Assigned To"], compare_assignee, _ASSIGNEE_RESULTS
     )
 
     return df
@@ -2,8 +2,10 @@
 
 import json
 import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from dotenv import load_dotenv
 
@@ -12,6 +14,38 @@ from jira_ado_traceability.models import Config
 # Load environment variables from .env file
 load_dotenv()
 
+# Values for optional settings a config file leaves out
+_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(
+    {"fuzzy_match_threshold": 70, "fuzzy_match_limit": 5, "ado_scan_days": 90, "data_source": "FILE"}
+)
+
+# Parsed config files by resolved path, with the mtime in ns and size they were read at;
+# an edited file is re-read and replaces its old entry
+_CONFIG_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_config_data(config_file: Path) -> dict[str, Any]:
+    """Read and parse a config file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        config_file: Path to an existing configuration JSON file
+
+    Returns:
+        Parsed configuration data, shared with the cache and not to be modified
+    """
+    stat = config_file.stat()
+    cache_key = str(config_file.resolve())
+
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with config_file.open(encoding="utf-8") as f:
+        config_data: dict[str, Any] = json.load(f)
+    _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config_data)
+
+    return config_data
+
 
 def load_config_from_file(config_path: str | Path) -> Config:
     """Load configuration from JSON file.
@@ -32,11 +66,14 @@ def load_config_from_file(config_path: str | Path) -> Config:
         msg = f"Configuration file not found: {config_path}"
         raise FileNotFoundError(msg)
 
-    with config_file.open(encoding="utf-8") as f:
-        config_data: dict[str, Any] = json.load(f)
+    # Merging builds a fresh dict, so the cached parse is never modified
+    config_data = {**_DEFAULTS, **_read_config_data(config_file)}
+
+    # Take one environment snapshot for all the overrides below
+    environ = dict(os.environ)
 
     # Get ADO PAT from environment variable or config
-    ado_pat = os.environ.get("ADO_PAT") or config_data.get("ado_pat", "")
+    ado_pat = environ.get("ADO_PAT") or config_data.get("ado_pat", "")
 
     if not ado_pat:
         msg = "ADO_PAT not found in environment or config file"
@@ -48,17 +85,17 @@ def load_config_from_file(config_path: str | Path) -> Config:
     ado_project = str(config_data.get("ado_project", ""))
     jira_data_file = config_data.get("jira_data_file")
     output_file = config_data.get("output_file")
-    fuzzy_match_threshold = int(config_data.get("fuzzy_match_threshold", 70))
-    fuzzy_match_limit = int(config_data.get("fuzzy_match_limit", 5))
-    ado_scan_days = int(config_data.get("ado_scan_days", 90))
+    fuzzy_match_threshold = int(config_data["fuzzy_match_threshold"])
+    fuzzy_match_limit = int(config_data["fuzzy_match_limit"])
+    ado_scan_days = int(config_data["ado_scan_days"])
 
     # Jira API fields (for API mode) - can be overridden by environment variables
-    jira_url = os.environ.get("JIRA_URL") or config_data.get("jira_url")
-    jira_username = os.environ.get("JIRA_USERNAME") or config_data.get("jira_username")
-    jira_api_token = os.environ.get("JIRA_API_TOKEN") or config_data.get("jira_api_token")
-    jira_project_key = os.environ.get("JIRA_PROJECT_KEY") or config_data.get("jira_project_key")
-    jira_jql = os.environ.get("JIRA_JQL") or config_data.get("jira_jql")
-    data_source = os.environ.get("DATA_SOURCE") or config_data.get("data_source", "FILE")
+    jira_url = environ.get("JIRA_URL") or config_data.get("jira_url")
+    jira_username = environ.get("JIRA_USERNAME") or config_data.get("jira_username")
+    jira_api_token = environ.get("JIRA_API_TOKEN") or config_data.get("jira_api_token")
+    jira_project_key = environ.get("JIRA_PROJECT_KEY") or config_data.get("jira_project_key")
+    jira_jql = environ.get("JIRA_JQL") or config_data.get("jira_jql")
+    data_source = environ.get("DATA_SOURCE") or config_data["data_source"]
 
     return Config(
         ado_server=ado_server,
@@ -145,10 +182,13 @@ def _validate_jira_config(
             raise ValueError(msg)
 
 
-def _load_env_vars(ado_pat: str | None, jira_data_file: str | None, output_file: str | None) -> dict[str, str | None]:
+def _load_env_vars(
+    environ: Mapping[str, str], ado_pat: str | None, jira_data_file: str | None, output_file: str | None
+) -> dict[str, str | None]:
     """Load environment variables with optional overrides.
 
     Args:
+        environ: Snapshot of the process environment
         ado_pat: Optional ADO PAT override
         jira_data_file: Optional Jira data file override
         output_file: Optional output file override
@@ -157,18 +197,18 @@ def _load_env_vars(ado_pat: str | None, jira_data_file: str | None, output_file:
         Dictionary of environment variables
     """
     return {
-        "ado_server": os.getenv("ADO_SERVER"),
-        "ado_collection": os.getenv("ADO_COLLECTION"),
-        "ado_project": os.getenv("ADO_PROJECT"),
-        "ado_pat": ado_pat or os.getenv("ADO_PAT"),
-        "jira_url": os.getenv("JIRA_URL"),
-        "jira_username": os.getenv("JIRA_USERNAME"),
-        "jira_api_token": os.getenv("JIRA_API_TOKEN"),
-        "jira_project_key": os.getenv("JIRA_PROJECT_KEY"),
-        "jira_jql": os.getenv("JIRA_JQL"),
-        "jira_data_file": jira_data_file or os.getenv("JIRA_INPUT_FILE"),
-        "output_file": output_file or os.getenv("OUTPUT_FILE"),
-        "data_source": os.getenv("DATA_SOURCE", "FILE"),
+        "ado_server": environ.get("ADO_SERVER"),
+        "ado_collection": environ.get("ADO_COLLECTION"),
+        "ado_project": environ.get("ADO_PROJECT"),
+        "ado_pat": ado_pat or environ.get("ADO_PAT"),
+        "jira_url": environ.get("JIRA_URL"),
+        "jira_username": environ.get("JIRA_USERNAME"),
+        "jira_api_token": environ.get("JIRA_API_TOKEN"),
+        "jira_project_key": environ.get("JIRA_PROJECT_KEY"),
+        "jira_jql": environ.get("JIRA_JQL"),
+        "jira_data_file": jira_data_file or environ.get("JIRA_INPUT_FILE"),
+        "output_file": output_file or environ.get("OUTPUT_FILE"),
+        "data_source": environ.get("DATA_SOURCE", _DEFAULTS["data_source"]),
     }
 
 
@@ -192,7 +232,8 @@ def create_manual_config(
     Raises:
         ValueError: If required environment variables are missing
     """
-    env = _load_env_vars(ado_pat, jira_data_file, output_file)
+    # Read the environment once so every setting comes from the same point-in-time view
+    env = _load_env_vars(dict(os.environ), ado_pat, jira_data_file, output_file)
 
     _validate_ado_config(env["ado_server"], env["ado_collection"], env["ado_project"], env["ado_pat"])
     _validate_jira_config(
@@ -5,11 +5,11 @@ from pathlib import Path
 
 import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
 from openpyxl.worksheet.worksheet import Worksheet
 
-from jira_ado_traceability.models import FuzzyMatch
+from jira_ado_traceability.models import NOT_LINKED, WARN_PREFIX, FuzzyMatch
+from jira_ado_traceability.reporter import comparison_counts
 
 
 def create_workbook() -> Workbook:
@@ -24,18 +24,51 @@ def create_workbook() -> Workbook:
     return wb
 
 
+def _header_style(color: str) -> NamedStyle:
+    """Build the named style used for header rows of a given color.
+
+    Args:
+        color: Hex color code for fill
+
+    Returns:
+        Named style with bold white text on a solid fill
+    """
+    return NamedStyle(
+        name=f"header_{color}",
+        font=Font(bold=True, color="FFFFFF"),
+        fill=PatternFill(start_color=color, end_color=color, fill_type="solid"),
+        alignment=Alignment(horizontal="center"),
+    )
+
+
 def format_header_row(sheet: Worksheet, row_num: int = 1, color: str = "4472C4") -> None:
     """Format header row with styling.
 
+    The header style is registered with the workbook once per color and shared by all header cells.
+
     Args:
         sheet: Worksheet to format
         row_num: Row number to format
         color: Hex color code for fill
     """
+    style_name = f"header_{color}"
+    if style_name not in sheet.parent.named_styles:
+        sheet.parent.add_named_style(_header_style(color))
+
     for cell in sheet[row_num]:
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
+        cell.style = style_name
+
+
+def append_dataframe(sheet: Worksheet, df: pd.DataFrame) -> None:
+    """Append a DataFrame to a worksheet as a header row followed by one row per record.
+
+    Args:
+        sheet: Worksheet to append to
+        df: DataFrame to write
+    """
+    sheet.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        sheet.append(row)
 
 
 def auto_adjust_columns(sheet: Worksheet, max_width: int = 50) -> None:
@@ -77,8 +110,7 @@ def add_summary_sheet(wb: Workbook, summary_df: pd.DataFrame) -> None:
     ws.append([])
     ws.append(["Summary Statistics"])
 
-    for row in dataframe_to_rows(summary_df, index=False, header=True):
-        ws.append(row)
+    append_dataframe(ws, summary_df)
 
     # Style header
     ws["A1"].font = Font(size=16, bold=True, color="FFFFFF")
@@ -93,8 +125,7 @@ def add_full_traceability_sheet(wb: Workbook, df: pd.DataFrame) -> None:
         df: Full traceability DataFrame
     """
     ws = wb.create_sheet("Full Traceability")
-    for row in dataframe_to_rows(df, index=False, header=True):
-        ws.append(row)
+    append_dataframe(ws, df)
 
     format_header_row(ws, row_num=1, color="4472C4")
     auto_adjust_columns(ws)
@@ -108,8 +139,7 @@ def add_mismatches_sheet(wb: Workbook, df_mismatches: pd.DataFrame) -> None:
         df_mismatches: DataFrame with mismatched items
     """
     ws = wb.create_sheet("Mismatches")
-    for row in dataframe_to_rows(df_mismatches, index=False, header=True):
-        ws.append(row)
+    append_dataframe(ws, df_mismatches)
 
     format_header_row(ws, row_num=1, color="C55A11")
 
@@ -122,8 +152,7 @@ def add_matched_items_sheet(wb: Workbook, df_matched: pd.DataFrame) -> None:
         df_matched: DataFrame with matched items
     """
     ws = wb.create_sheet("Matched Items")
-    for row in dataframe_to_rows(df_matched, index=False, header=True):
-        ws.append(row)
+    append_dataframe(ws, df_matched)
 
     format_header_row(ws, row_num=1, color="28A745")
     auto_adjust_columns(ws)
@@ -138,23 +167,12 @@ def _calculate_match_statistics(df_matched: pd.DataFrame) -> dict[str, int]:
     Returns:
         Dictionary with calculated statistics
     """
+    # Comparison quality comes from the same counts as the Summary sheet so the two always agree
     return {
         "total_matched": len(df_matched),
         "matched_closed": len(df_matched[df_matched["Jira Status Category"] == "Done"]),
         "matched_open": len(df_matched[df_matched["Jira Status Category"] != "Done"]),
-        "matched_status_ok": len(df_matched[df_matched["Status Comparison"].str.contains("[OK]", na=False)]),
-        "matched_status_warn": len(df_matched[df_matched["Status Comparison"].str.contains("[WARN]", na=False)]),
-        "matched_severity_ok": len(df_matched[df_matched["Severity Comparison"].str.contains("[OK]", na=False)]),
-        "matched_severity_warn": len(df_matched[df_matched["Severity Comparison"].str.contains("[WARN]", na=False)]),
-        "matched_assignee_ok": len(df_matched[df_matched["Assignee Match"].str.contains("[OK]", na=False)]),
-        "matched_assignee_warn": len(df_matched[df_matched["Assignee Match"].str.contains("[WARN]", na=False)]),
-        "perfect_matches": len(
-            df_matched[
-                (df_matched["Status Comparison"].str.contains("[OK]", na=False))
-                & (df_matched["Severity Comparison"].str.contains("[OK]", na=False))
-                & (df_matched["Assignee Match"].str.contains("[OK]", na=False))
-            ]
-        ),
+        **comparison_counts(df_matched),
     }
 
 
@@ -199,12 +217,12 @@ def _add_comparison_quality(ws: Worksheet, stats: dict[str, int]) -> None:
 
     metrics = [
         ("Perfect Matches (All 3 Criteria)", "perfect_matches"),
-        ("Status Matches", "matched_status_ok"),
-        ("Status Mismatches", "matched_status_warn"),
-        ("Severity Matches", "matched_severity_ok"),
-        ("Severity Mismatches", "matched_severity_warn"),
-        ("Assignee Matches", "matched_assignee_ok"),
-        ("Assignee Mismatches", "matched_assignee_warn"),
+        ("Status Matches", "status_matches"),
+        ("Status Mismatches", "status_mismatches"),
+        ("Severity Matches", "severity_matches"),
+        ("Severity Mismatches", "severity_mismatches"),
+        ("Assignee Matches", "assignee_matches"),
+        ("Assignee Mismatches", "assignee_mismatches"),
     ]
 
     for label, key in metrics:
@@ -245,6 +263,11 @@ def add_matched_summary_sheet(wb: Workbook, df_matched: pd.DataFrame) -> None:
     ws.append(["Generated on:", datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")])
     ws.append([])
 
+    if df_matched.empty:
+        ws.append(["No matched items found"])
+        _style_matched_summary_sheet(ws)
+        return
+
     stats = _calculate_match_statistics(df_matched)
     _add_overall_statistics(ws, stats)
     _add_comparison_quality(ws, stats)
@@ -299,8 +322,7 @@ def add_fuzzy_matches_sheet(wb: Workbook, fuzzy_matches: list[FuzzyMatch]) -> No
 
     if len(fuzzy_matches) > 0:
         df_fuzzy = pd.DataFrame(fuzzy_matches)
-        for row in dataframe_to_rows(df_fuzzy, index=False, header=True):
-            ws.append(row)
+        append_dataframe(ws, df_fuzzy)
 
         format_header_row(ws, row_num=1, color="FFA500")
         auto_adjust_columns(ws)
@@ -330,8 +352,7 @@ def add_unlinked_issues_sheet(wb: Workbook, df_unlinked: pd.DataFrame) -> None:
     """
     ws = wb.create_sheet("Unlinked Issues")
     cols = ["Jira Key", "Jira Summary", "Jira Status", "Jira Severity", "Jira Assignee"]
-    for row in dataframe_to_rows(df_unlinked[cols], index=False, header=True):
-        ws.append(row)
+    append_dataframe(ws, df_unlinked[cols])
 
     format_header_row(ws, row_num=1, color="E74C3C")
 
@@ -365,13 +386,13 @@ def generate_excel_report(
 
     # Create filtered DataFrames
     # Only include linked items (not "Not Linked") that have actual mismatches
-    df_matched = df[df["ADO ID"] != "Not Linked"].copy()
+    df_matched = df[df["ADO ID"] != NOT_LINKED].copy()
     df_mismatches = df_matched[
-        df_matched["Status Comparison"].str.contains("[WARN]", na=False)
-        | df_matched["Severity Comparison"].str.contains("[WARN]", na=False)
-        | df_matched["Assignee Match"].str.contains("[WARN]", na=False)
+        df_matched["Status Comparison"].str.startswith(WARN_PREFIX, na=False)
+        | df_matched["Severity Comparison"].str.startswith(WARN_PREFIX, na=False)
+        | df_matched["Assignee Match"].str.startswith(WARN_PREFIX, na=False)
     ]
-    df_unlinked = df[df["ADO ID"] == "Not Linked"]
+    df_unlinked = df[df["ADO ID"] == NOT_LINKED]
 
     # Add sheets
     add_summary_sheet(wb, summary_df)
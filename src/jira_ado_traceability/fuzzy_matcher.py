@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process, utils
 
 from jira_ado_traceability.models import FuzzyMatch
 
+# Lower bounds of the "High" and "Very High" buckets; anything below is "Medium"
+_CONFIDENCE_BINS = (80, 90)
+_CONFIDENCE_LABELS = np.array(["Medium", "High", "Very High"], dtype=object)
+
+# Common words ignored when looking for candidate titles that share a token
+_STOP_WORDS = frozenset({"a", "and", "for", "is", "of", "the", "to"})
+
 
 def get_confidence_level(score: int) -> str:
     """Determine confidence level based on match score.
@@ -19,62 +29,124 @@ def get_confidence_level(score: int) -> str:
     Returns:
         Confidence level string
     """
-    if score >= 90:
-        return "Very High"
-    if score >= 80:
-        return "High"
-    return "Medium"
+    # Same buckets as the vectorised np.digitize in find_fuzzy_matches
+    return str(_CONFIDENCE_LABELS[bisect_right(_CONFIDENCE_BINS, score)])
 
 
-def _process_jira_row_matches(
-    jira_row: pd.Series[Any],
-    ado_titles: dict[str, str],
-    ado_work_items: list[dict[str, Any]],
+def _presort(text: str) -> str:
+    """Normalize text and sort its tokens, matching what token_sort_ratio does per comparison.
+
+    Args:
+        text: Raw title or summary
+
+    Returns:
+        Lowercased, punctuation-stripped tokens joined in sorted order
+    """
+    return " ".join(sorted(utils.default_process(text).split()))
+
+
+def _build_token_index(presorted_titles: list[str]) -> dict[str, list[int]]:
+    """Build an inverted index from title token to ADO item positions.
+
+    Args:
+        presorted_titles: Normalized ADO titles
+
+    Returns:
+        Dictionary mapping each non-stop-word token to the positions of titles containing it
+    """
+    token_index: dict[str, list[int]] = {}
+    for position, title in enumerate(presorted_titles):
+        for token in set(title.split()) - _STOP_WORDS:
+            token_index.setdefault(token, []).append(position)
+    return token_index
+
+
+def _candidate_positions(presorted_query: str, token_index: dict[str, list[int]]) -> list[int]:
+    """Find ADO item positions sharing at least one non-stop-word token with the query.
+
+    Args:
+        presorted_query: Normalized Jira summary
+        token_index: Inverted index from _build_token_index
+
+    Returns:
+        Sorted list of candidate ADO item positions
+    """
+    candidates: set[int] = set()
+    for token in set(presorted_query.split()) - _STOP_WORDS:
+        candidates.update(token_index.get(token, ()))
+    return sorted(candidates)
+
+
+def _select_top_matches(
+    scores: npt.NDArray[np.uint8],
     threshold: int,
     limit: int,
-) -> list[FuzzyMatch]:
-    """Process fuzzy matches for a single Jira row.
+) -> npt.NDArray[np.intp]:
+    """Select the best scoring candidates for a single Jira summary.
 
     Args:
-        jira_row: Single Jira issue row
-        ado_titles: Dictionary of ADO IDs to titles
-        ado_work_items: List of ADO work items
+        scores: Scores of one Jira summary against its candidates
         threshold: Minimum match score
-        limit: Maximum matches per issue
+        limit: Maximum matches per Jira summary
 
     Returns:
-        List of fuzzy matches for this Jira issue
+        Candidate positions ordered by descending score
     """
-    jira_summary = str(jira_row["Jira Summary"])
-    # fuzzywuzzy returns list of tuples: (match_str, score) or (match_str, score, index)
-    # Type ignore needed due to fuzzywuzzy incomplete type stubs
-    matches = process.extract(jira_summary, ado_titles, scorer=fuzz.token_sort_ratio, limit=limit)  # type: ignore[assignment]
-    fuzzy_matches: list[FuzzyMatch] = []
-
-    for match in matches:
-        # Extract title and score from tuple (fuzzywuzzy returns variable-length tuples)
-        ado_title: str = str(match[0])
-        score: int = int(match[1])
-        ado_id = _find_ado_id_by_title(ado_titles, ado_title)
-
-        if score >= threshold and ado_id:
-            work_item = _find_work_item_by_id(ado_work_items, ado_id)
-            if work_item:
-                fuzzy_matches.append(
-                    FuzzyMatch(
-                        jira_key=str(jira_row["Jira Key"]),
-                        jira_summary=jira_summary,
-                        jira_status=str(jira_row["Jira Status"]),
-                        potential_ado_id=ado_id,
-                        ado_title=ado_title,
-                        ado_state=str(work_item["state"]),
-                        ado_work_item_type=str(work_item["work_item_type"]),
-                        match_score=score,
-                        confidence=get_confidence_level(score),
-                    )
-                )
+    keep = np.flatnonzero(scores >= threshold)
+    if len(keep) > limit > 0:
+        # Partition out the limit-th best score instead of sorting every candidate;
+        # ties at that score are filled in candidate order, as a stable sort would
+        boundary = np.partition(scores[keep], len(keep) - limit)[len(keep) - limit]
+        above = keep[scores[keep] > boundary]
+        tied = keep[scores[keep] == boundary][: limit - len(above)]
+        keep = np.concatenate((above, tied))
+
+    # Widen before negating: unsigned scores would wrap around
+    return keep[np.argsort(-scores[keep].astype(np.int16), kind="stable")][:limit]
+
+
+def _score_candidates(
+    jira_presorted: list[str],
+    ado_presorted: list[str],
+    threshold: int,
+    limit: int,
+) -> tuple[list[int], list[int], list[int]]:
+    """Score each Jira summary against the ADO titles it shares tokens with.
 
-    return fuzzy_matches
+    Args:
+        jira_presorted: Normalized Jira summaries
+        ado_presorted: Normalized ADO titles
+        threshold: Minimum match score
+        limit: Maximum matches per Jira summary
+
+    Returns:
+        Tuple of (Jira row positions, ADO item positions, scores) for kept matches
+    """
+    token_index = _build_token_index(ado_presorted)
+    rows: list[int] = []
+    cols: list[int] = []
+    kept_scores: list[int] = []
+
+    for row, query in enumerate(jira_presorted):
+        candidates = _candidate_positions(query, token_index)
+        if not candidates:
+            continue
+
+        # Scores fit in a byte; pairs clearly under the threshold come back as 0 without a full computation.
+        # The cutoff applies before rounding, so leave one point of slack for scores that round up to it.
+        scores: npt.NDArray[np.uint8] = process.cdist(
+            [query],
+            [ado_presorted[col] for col in candidates],
+            scorer=fuzz.ratio,
+            score_cutoff=max(threshold - 1, 0),
+            dtype=np.uint8,
+        )[0]
+        top = _select_top_matches(scores, threshold, limit)
+        rows.extend([row] * len(top))
+        cols.extend(candidates[position] for position in top.tolist())
+        kept_scores.extend(scores[top].tolist())
+
+    return rows, cols, kept_scores
 
 
 def find_fuzzy_matches(
@@ -85,6 +157,8 @@ def find_fuzzy_matches(
 ) -> list[FuzzyMatch]:
     """Find potential matches between unlinked Jira issues and ADO work items.
 
+    Only ADO items sharing at least one meaningful word with a Jira summary are scored.
+
     Args:
         unlinked_jira_df: DataFrame of Jira issues without ADO links
         ado_work_items: List of ADO work items to match against
@@ -94,49 +168,41 @@ def find_fuzzy_matches(
     Returns:
         List of fuzzy matches
     """
-    if len(ado_work_items) == 0 or len(unlinked_jira_df) == 0:
+    if unlinked_jira_df.empty or not ado_work_items:
         return []
 
-    ado_titles = {item["id"]: item["title"] for item in ado_work_items}
-    fuzzy_matches: list[FuzzyMatch] = []
-
     print(f"\nAnalyzing {len(unlinked_jira_df)} unlinked Jira items for potential matches...")
 
-    for _, jira_row in unlinked_jira_df.iterrows():
-        row_matches = _process_jira_row_matches(jira_row, ado_titles, ado_work_items, threshold, limit)
-        fuzzy_matches.extend(row_matches)
+    jira_keys = unlinked_jira_df["Jira Key"].astype(str).tolist()
+    jira_summaries = unlinked_jira_df["Jira Summary"].astype(str).tolist()
+    jira_statuses = unlinked_jira_df["Jira Status"].astype(str).tolist()
+    # Parallel per-field lists so building results is plain indexing, not a dict lookup per match
+    ado_ids = [str(item["id"]) for item in ado_work_items]
+    ado_titles = [str(item["title"]) for item in ado_work_items]
+    ado_states = [str(item["state"]) for item in ado_work_items]
+    ado_types = [str(item["work_item_type"]) for item in ado_work_items]
+
+    # Tokenize and sort each string once; plain ratio on the sorted forms equals token_sort_ratio
+    jira_presorted = [_presort(summary) for summary in jira_summaries]
+    ado_presorted = [_presort(title) for title in ado_titles]
+
+    rows, cols, kept_scores = _score_candidates(jira_presorted, ado_presorted, threshold, limit)
+    confidences = _CONFIDENCE_LABELS[np.digitize(kept_scores, _CONFIDENCE_BINS)]
+
+    fuzzy_matches = [
+        FuzzyMatch(
+            jira_key=jira_keys[row],
+            jira_summary=jira_summaries[row],
+            jira_status=jira_statuses[row],
+            potential_ado_id=ado_ids[col],
+            ado_title=ado_titles[col],
+            ado_state=ado_states[col],
+            ado_work_item_type=ado_types[col],
+            match_score=score,
+            confidence=confidence,
+        )
+        for row, col, score, confidence in zip(rows, cols, kept_scores, confidences.tolist(), strict=True)
+    ]
 
     print(f"Found {len(fuzzy_matches)} potential matches based on title similarity")
     return fuzzy_matches
-
-
-def _find_ado_id_by_title(ado_titles: dict[str, str], title: str) -> str | None:
-    """Find ADO ID by title.
-
-    Args:
-        ado_titles: Dictionary mapping ADO IDs to titles
-        title: Title to search for
-
-    Returns:
-        ADO ID or None
-    """
-    for ado_id, ado_title in ado_titles.items():
-        if ado_title == title:
-            return ado_id
-    return None
-
-
-def _find_work_item_by_id(work_items: list[dict[str, Any]], work_item_id: str) -> dict[str, Any] | None:
-    """Find work item by ID.
-
-    Args:
-        work_items: List of work items
-        work_item_id: Work item ID to find
-
-    Returns:
-        Work item dictionary or None
-    """
-    for item in work_items:
-        if item["id"] == work_item_id:
-            return item
-    return None
@@ -1,5 +1,6 @@
 """Jira Cloud API client for fetching issue data."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
@@ -33,7 +34,48 @@ class JiraClient:
             Dictionary containing search results with issues list
 
         Raises:
-            requests.RequestException: If API request fails
+            ValueError: If no JQL query is available
+        """
+        return self._search(self._resolve_jql(jql), max_results)
+
+    def connect_and_search(self, jql: str | None = None, max_results: int = 1000) -> dict[str, Any]:
+        """Test the connection and search for issues, fetching the first page during the auth check.
+
+        Args:
+            jql: JQL query string (uses config default if not provided)
+            max_results: Maximum number of results to return
+
+        Returns:
+            Dictionary containing search results with issues list
+
+        Raises:
+            ValueError: If no JQL query is available
+            ConnectionError: If the connection test fails
+        """
+        query = self._resolve_jql(jql)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            connected = executor.submit(self.test_connection)
+            first_page = executor.submit(self._fetch_issues_batch, query, 0, min(max_results, 100))
+
+            if not connected.result():
+                msg = "Failed to connect to Jira API. Check credentials and URL."
+                raise ConnectionError(msg)
+
+            print("\n[JIRA API] Fetching issues...")
+            return self._search(query, max_results, first_page)
+
+    def _resolve_jql(self, jql: str | None) -> str:
+        """Resolve the JQL query to run.
+
+        Args:
+            jql: Explicit JQL query string, if any
+
+        Returns:
+            JQL query string
+
+        Raises:
+            ValueError: If neither an explicit nor a configured query is available
         """
         query = jql or self.config.jira_jql or ""
 
@@ -41,6 +83,24 @@ class JiraClient:
             msg = "No JQL query provided"
             raise ValueError(msg)
 
+        return query
+
+    def _search(
+        self,
+        query: str,
+        max_results: int,
+        first_page: Future[requests.Response] | None = None,
+    ) -> dict[str, Any]:
+        """Page through search results.
+
+        Args:
+            query: JQL query string
+            max_results: Maximum number of results to return
+            first_page: Already in-flight request for the first page, if any
+
+        Returns:
+            Dictionary containing search results with issues list
+        """
         print(f"Fetching Jira issues with JQL: {query}")
 
         all_issues: list[dict[str, Any]] = []
@@ -49,7 +109,11 @@ class JiraClient:
 
         while len(all_issues) < max_results:
             try:
-                response = self._fetch_issues_batch(query, start_at, batch_size)
+                response = (
+                    first_page.result()
+                    if first_page is not None and start_at == 0
+                    else self._fetch_issues_batch(query, start_at, batch_size)
+                )
 
                 if response.status_code != 200:
                     print(f"  [ERROR] HTTP {response.status_code}: {response.text}")
@@ -194,6 +258,7 @@ def fetch_jira_issues_from_api(config: Config) -> dict[str, Any]:
 
     Raises:
         ValueError: If configuration is invalid
+        ConnectionError: If the Jira connection test fails
     """
     # Validate required fields
     if not config.jira_url:
@@ -214,11 +279,5 @@ def fetch_jira_issues_from_api(config: Config) -> dict[str, Any]:
 
     client = JiraClient(config)
 
-    # Test connection first
-    if not client.test_connection():
-        msg = "Failed to connect to Jira API. Check credentials and URL."
-        raise ConnectionError(msg)
-
-    # Fetch issues
-    print("\n[JIRA API] Fetching issues...")
-    return client.search_issues()
+    # Test connection and fetch issues, overlapping the auth round trip with the first page
+    return client.connect_and_search()
@@ -1,11 +1,58 @@
 """Jira issue parser for extracting and transforming issue data."""
 
+from __future__ import annotations
+
 import json
+import mmap
+import sys
+from itertools import batched
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import ijson
+import numpy as np
+import numpy.typing as npt
+import orjson
 import pandas as pd
 
+from jira_ado_traceability.models import NOT_APPLICABLE, NOT_LINKED
+
+# Output column, path to the raw value within an issue, and default for missing or blank values.
+# Date columns have no default; they are parsed into timestamps (NaT where missing).
+_FIELD_EXTRACTORS: tuple[tuple[str, tuple[str, ...], str | None], ...] = (
+    ("Jira Key", ("key",), ""),
+    ("Jira Summary", ("fields", "summary"), ""),
+    ("Jira Status", ("fields", "status", "name"), "Unknown"),
+    ("Jira Status Category", ("fields", "status", "statusCategory", "name"), "Unknown"),
+    ("Jira Priority", ("fields", "priority", "name"), "None"),
+    ("Jira Severity", ("fields", "customfield_10042", "value"), "None"),
+    ("Jira Assignee", ("fields", "assignee", "displayName"), "Unassigned"),
+    ("Jira Created", ("fields", "created"), None),
+    ("Jira Resolved", ("fields", "resolutiondate"), None),
+    ("ADO ID", ("fields", "customfield_10109"), NOT_LINKED),
+    ("ADO State (Jira)", ("fields", "customfield_10110"), NOT_APPLICABLE),
+)
+
+# Columns with a small vocabulary; interning lets every row share one string object per value
+_INTERNED_COLUMNS = frozenset(
+    {"Jira Status", "Jira Status Category", "Jira Priority", "Jira Severity", "Jira Assignee", "ADO State (Jira)"}
+)
+
+# High-cardinality text columns, stored in contiguous Arrow buffers rather than as one Python object per row
+_ARROW_COLUMNS = frozenset({"Jira Key", "Jira Summary", "ADO ID"})
+_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+# Exports below this size are read into memory in one call, which is cheapest for small files.
+# At or above it, load_and_parse_jira_issues streams issues in batches so the decoded document is
+# never held alongside the DataFrame built from it, and load_jira_data, which has to return the
+# whole document, memory-maps the file instead of copying it onto the heap first.
+_LARGE_EXPORT_BYTES = 8 * 1024 * 1024
+_STREAM_BATCH_SIZE = 10_000
+
+# Shared stand-in for missing or null nested objects, so lookups never allocate a fresh {}
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 def load_jira_data(file_path: str | Path) -> dict[str, Any]:
     """Load Jira data from JSON file.
@@ -26,103 +73,203 @@ def load_jira_data(file_path: str | Path) -> dict[str, Any]:
         msg = f"Jira data file not found: {file_path}"
         raise FileNotFoundError(msg)
 
-    with data_file.open(encoding="utf-8") as f:
-        return json.load(f)
+    # orjson parses the raw bytes directly; its JSONDecodeError subclasses json.JSONDecodeError
+    if data_file.stat().st_size < _LARGE_EXPORT_BYTES:
+        return orjson.loads(data_file.read_bytes())
+
+    # Parse straight from the page cache instead of copying the whole export onto the heap
+    with (
+        data_file.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as view,
+    ):
+        return orjson.loads(view)
 
 
-def _parse_jira_dates(fields: dict[str, Any]) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
-    """Parse date fields from Jira issue.
+def _walk(nodes: list[Any], key: str) -> list[Any]:
+    """Step one key deeper into a list of nested issue dictionaries.
 
     Args:
-        fields: Jira issue fields dictionary
+        nodes: Dictionaries (or None) at the current depth, one per issue
+        key: Key to look up in each
 
     Returns:
-        Tuple of (created_date, resolved_date)
+        Values one level deeper, None where the key is missing or the node is null
     """
-    created = fields.get("created", "")
-    jira_created: pd.Timestamp | None = None
-    if created:
-        parsed_created = pd.to_datetime(created, utc=True)
-        jira_created = parsed_created.tz_localize(None) if hasattr(parsed_created, "tz_localize") else None
+    return [(node or _EMPTY).get(key) for node in nodes]
+
+
+def _intern_all(values: list[Any]) -> list[Any]:
+    """Intern string values so repeated values share a single object.
 
-    resolutiondate = fields.get("resolutiondate")
-    jira_resolved: pd.Timestamp | None = None
-    if resolutiondate:
-        parsed_resolved = pd.to_datetime(resolutiondate, utc=True)
-        jira_resolved = parsed_resolved.tz_localize(None) if hasattr(parsed_resolved, "tz_localize") else None
+    Args:
+        values: Raw column values
+
+    Returns:
+        Values with strings interned and anything else unchanged
+    """
+    return [sys.intern(value) if type(value) is str else value for value in values]
 
-    return jira_created, jira_resolved
 
+def _collect_columns(issues: list[dict[str, Any]]) -> dict[str, npt.NDArray[np.object_]]:
+    """Gather raw field values from all issues into one object array per output column.
 
-def _extract_jira_fields(fields: dict[str, Any]) -> dict[str, Any]:
-    """Extract and parse Jira fields into a structured dictionary.
+    Paths are walked level by level across all issues, so shared prefixes such as
+    ("fields", "status") are looked up once rather than once per column.
 
     Args:
-        fields: Jira issue fields dictionary
+        issues: Raw Jira issue dictionaries
 
     Returns:
-        Dictionary with extracted field values
+        Dictionary mapping output column names to raw values (None where absent)
     """
-    status = fields.get("status", {})
-    priority = fields.get("priority", {})
-    severity = fields.get("customfield_10042", {})
-    assignee = fields.get("assignee", {})
-
-    jira_created, jira_resolved = _parse_jira_dates(fields)
+    levels: dict[tuple[str, ...], list[Any]] = {(): issues}
+    for _, path, _ in _FIELD_EXTRACTORS:
+        for depth in range(1, len(path) + 1):
+            if path[:depth] not in levels:
+                levels[path[:depth]] = _walk(levels[path[: depth - 1]], path[depth - 1])
 
+    # Fill preallocated object arrays, which pandas wraps without copying or re-inferring types
     return {
-        "summary": fields.get("summary", ""),
-        "status": status.get("name", "Unknown"),
-        "status_category": status.get("statusCategory", {}).get("name", "Unknown"),
-        "priority": priority.get("name", "None") if priority else "None",
-        "severity": severity.get("value", "None") if severity else "None",
-        "assignee": assignee.get("displayName", "Unassigned") if assignee else "Unassigned",
-        "created": jira_created,
-        "resolved": jira_resolved,
-        "ado_id": fields.get("customfield_10109", ""),
-        "ado_state": fields.get("customfield_10110", ""),
+        column: np.fromiter(
+            _intern_all(levels[path]) if column in _INTERNED_COLUMNS else levels[path], dtype=object, count=len(issues)
+        )
+        for column, path, _ in _FIELD_EXTRACTORS
     }
 
 
-def parse_jira_issue(issue: dict[str, Any]) -> dict[str, Any]:
-    """Parse a single Jira issue into structured format.
+def _fill_defaults(values: npt.NDArray[np.object_], default: str) -> pd.Series[Any]:
+    """Build a column, replacing missing and blank values with a default.
 
     Args:
-        issue: Raw Jira issue dictionary
+        values: Raw column values
+        default: Value for missing or blank fields
 
     Returns:
-        Parsed issue data dictionary
+        Column values
     """
-    fields = issue.get("fields", {})
-    extracted = _extract_jira_fields(fields)
+    column = pd.Series(values, dtype=object, copy=False)
+    return column.where(column.notna() & (column != ""), default)
+
+
+def _parse_dates(values: npt.NDArray[np.object_]) -> pd.Series[Any]:
+    """Parse ISO 8601 date strings into timezone-naive UTC timestamps.
+
+    Args:
+        values: Raw date strings (None where absent)
 
+    Returns:
+        Datetime column, NaT where the date is missing
+    """
+    # Jira exports repeat timestamps heavily (bulk updates), so cache parsed values per unique string
+    parsed = pd.to_datetime(
+        pd.Series(values, dtype=object, copy=False), utc=True, format="ISO8601", cache=True, errors="coerce"
+    )
+    return parsed.dt.tz_localize(None)
+
+
+def _build_column(
+    column: str, values: npt.NDArray[np.object_], default: str | None, *, parse_dates: bool
+) -> pd.Series[Any]:
+    """Convert one column of raw values into its final dtype.
+
+    Args:
+        column: Output column name
+        values: Raw column values
+        default: Value for missing or blank fields, or None for date columns
+        parse_dates: Whether date columns are parsed or left as raw ISO 8601 strings
+
+    Returns:
+        Column values
+    """
+    if default is None:
+        return _parse_dates(values) if parse_dates else pd.Series(values, dtype=object, copy=False)
+
+    filled = _fill_defaults(values, default)
+    return filled.astype(_STRING_DTYPE) if column in _ARROW_COLUMNS else filled
+
+
+def _build_columns(columns: dict[str, npt.NDArray[np.object_]], *, parse_dates: bool) -> dict[str, pd.Series[Any]]:
+    """Convert raw column values into one finished column per output field.
+
+    Args:
+        columns: Raw values per output column, as gathered by _collect_columns
+        parse_dates: Whether date columns are parsed or left as raw ISO 8601 strings
+
+    Returns:
+        Dictionary mapping output column names to column values, in output order
+    """
     return {
-        "Jira Key": issue.get("key", ""),
-        "Jira Summary": extracted["summary"],
-        "Jira Status": extracted["status"],
-        "Jira Status Category": extracted["status_category"],
-        "Jira Priority": extracted["priority"],
-        "Jira Severity": extracted["severity"],
-        "Jira Assignee": extracted["assignee"],
-        "Jira Created": extracted["created"],
-        "Jira Resolved": extracted["resolved"],
-        "ADO ID": extracted["ado_id"] if extracted["ado_id"] else "Not Linked",
-        "ADO State (Jira)": extracted["ado_state"] if extracted["ado_state"] else "N/A",
+        column: _build_column(column, columns[column], default, parse_dates=parse_dates)
+        for column, _, default in _FIELD_EXTRACTORS
     }
 
 
-def parse_jira_issues(jira_data: dict[str, Any]) -> pd.DataFrame:
+def _parse_columns(issues: list[dict[str, Any]], *, parse_dates: bool) -> dict[str, pd.Series[Any]]:
+    """Parse issues into one finished column per output field.
+
+    Args:
+        issues: Raw Jira issue dictionaries
+        parse_dates: Whether date columns are parsed or left as raw ISO 8601 strings
+
+    Returns:
+        Dictionary mapping output column names to column values, in output order
+    """
+    return _build_columns(_collect_columns(issues), parse_dates=parse_dates)
+
+
+def parse_jira_issues(jira_data: dict[str, Any], *, parse_dates: bool = True) -> pd.DataFrame:
     """Parse all Jira issues from data dictionary.
 
     Args:
         jira_data: Dictionary containing Jira issues
+        parse_dates: Parse created/resolved dates into timestamps; pass False when only
+            the raw ISO 8601 strings are needed (missing dates are then None)
 
     Returns:
         DataFrame with parsed Jira issues
     """
-    issues = jira_data.get("issues", [])
-    parsed_data = [parse_jira_issue(issue) for issue in issues]
-    return pd.DataFrame(parsed_data)
+    return pd.DataFrame(_parse_columns(jira_data.get("issues", []), parse_dates=parse_dates), copy=False)
+
+
+def parse_jira_issue(issue: dict[str, Any]) -> dict[str, Any]:
+    """Parse a single Jira issue into structured format.
+
+    Args:
+        issue: Raw Jira issue dictionary
+
+    Returns:
+        Parsed issue data dictionary (missing dates are NaT)
+    """
+    return {column: values.iat[0] for column, values in _parse_columns([issue], parse_dates=True).items()}
+
+
+def _stream_and_parse_jira_issues(data_file: Path) -> pd.DataFrame:
+    """Parse a large Jira export in batches while streaming issues from disk.
+
+    Args:
+        data_file: Path to Jira JSON data file
+
+    Returns:
+        DataFrame with parsed Jira issues
+
+    Raises:
+        json.JSONDecodeError: If file contains invalid JSON
+    """
+    # Only the extracted field values of each batch are kept, not the issue dictionaries
+    with data_file.open("rb") as f:
+        issues = ijson.items(f, "issues.item", use_float=True)
+        try:
+            chunks = [_collect_columns(list(batch)) for batch in batched(issues, _STREAM_BATCH_SIZE, strict=False)]
+        except ijson.JSONError as e:
+            # Surface the same error type as the in-memory path
+            raise json.JSONDecodeError(str(e), "", f.tell()) from e
+
+    if not chunks:
+        return parse_jira_issues({})
+
+    columns = {column: np.concatenate([chunk[column] for chunk in chunks]) for column, _, _ in _FIELD_EXTRACTORS}
+    return pd.DataFrame(_build_columns(columns, parse_dates=True), copy=False)
 
 
 def load_and_parse_jira_issues(file_path: str | Path) -> pd.DataFrame:
@@ -138,5 +285,9 @@ def load_and_parse_jira_issues(file_path: str | Path) -> pd.DataFrame:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If file contains invalid JSON
     """
+    data_file = Path(file_path)
+    if data_file.exists() and data_file.stat().st_size >= _LARGE_EXPORT_BYTES:
+        return _stream_and_parse_jira_issues(data_file)
+
     jira_data = load_jira_data(file_path)
     return parse_jira_issues(jira_data)
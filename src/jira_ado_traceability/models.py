@@ -1,8 +1,22 @@
 """Data models for Jira-ADO traceability."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TypedDict
+from typing import Final, TypedDict
+
+# Labels written into the traceability DataFrame by the parser and comparator, and matched on by
+# the reports; every producer and consumer imports them from here so the two sides cannot drift
+NOT_LINKED: Final = "Not Linked"
+NOT_APPLICABLE: Final = "N/A"
+NO_ADO_LINK: Final = "No ADO Link"
+OK_PREFIX: Final = "[OK]"
+WARN_PREFIX: Final = "[WARN]"
+STATUS_BOTH_CLOSED: Final = f"{OK_PREFIX} Both Closed"
+STATUS_BOTH_OPEN: Final = f"{OK_PREFIX} Both Open"
+STATUS_JIRA_CLOSED: Final = f"{WARN_PREFIX} Jira Closed, ADO Open"
+STATUS_ADO_CLOSED: Final = f"{WARN_PREFIX} ADO Closed, Jira Open"
+RESULT_MATCH: Final = f"{OK_PREFIX} Match"
+ASSIGNEE_DIFFERENT: Final = f"{WARN_PREFIX} Different"
 
 
 class JiraIssue(TypedDict, total=False):
@@ -21,7 +35,8 @@ class JiraIssue(TypedDict, total=False):
     ado_state_jira: str
 
 
-class AdoWorkItem(TypedDict):
+@dataclass(slots=True, frozen=True)
+class AdoWorkItem:
     """ADO work item data structure.
 
     All fields are required to ensure type safety.
@@ -41,7 +56,8 @@ class AdoWorkItem(TypedDict):
     iteration_path: str
 
 
-class FuzzyMatch(TypedDict):
+@dataclass(slots=True, frozen=True)
+class FuzzyMatch:
     """Fuzzy match result structure."""
 
     jira_key: str
@@ -55,7 +71,7 @@ class FuzzyMatch(TypedDict):
     confidence: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Configuration for Jira-ADO traceability."""
 
@@ -82,7 +98,10 @@ class Config:
     fuzzy_match_limit: int = 5
     ado_scan_days: int = 90
 
-    @property
-    def ado_api_base(self) -> str:
-        """Get ADO API base URL."""
-        return f"{self.ado_server}/{self.ado_collection}/{self.ado_project}/_apis"
+    # Derived: ADO API base URL, built once from the server, collection and project
+    ado_api_base: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the ADO API base URL."""
+        # Frozen dataclass: derived fields have to bypass the generated __setattr__
+        object.__setattr__(self, "ado_api_base", f"{self.ado_server}/{self.ado_collection}/{self.ado_project}/_apis")
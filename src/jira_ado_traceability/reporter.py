@@ -1,7 +1,98 @@
 """Summary statistics and reporting functions."""
 
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from jira_ado_traceability.models import NOT_LINKED, OK_PREFIX, STATUS_BOTH_CLOSED, STATUS_BOTH_OPEN, WARN_PREFIX
+
+_COMPARISON_COLUMNS = ("Status Comparison", "Severity Comparison", "Assignee Match")
+
+# Metrics derived from the comparison results of linked items
+_COMBINATION_METRICS = (
+    "both_closed",
+    "both_open",
+    "status_matches",
+    "severity_matches",
+    "assignee_matches",
+    "status_mismatches",
+    "severity_mismatches",
+    "assignee_mismatches",
+    "perfect_matches",
+)
+
+
+def _linked_mask(df: pd.DataFrame) -> npt.NDArray[np.bool_]:
+    """Flag rows that are linked to an ADO work item.
+
+    Args:
+        df: Full traceability DataFrame
+
+    Returns:
+        Boolean array, True where the row has an ADO link
+    """
+    # Compare in the column's own storage; to_numpy() first would box every Arrow string
+    return (df["ADO ID"] != NOT_LINKED).to_numpy(dtype=bool)
+
+
+def comparison_counts(df_linked: pd.DataFrame) -> dict[str, int]:
+    """Derive comparison metrics from how often each distinct result combination occurs.
+
+    Args:
+        df_linked: Linked rows of the traceability DataFrame
+
+    Returns:
+        Dictionary of metric name to count
+    """
+    counts: dict[str, int] = dict.fromkeys(_COMBINATION_METRICS, 0)
+    results = df_linked.loc[:, list(_COMPARISON_COLUMNS)]
+    # The comparator already emits categoricals; plain string columns are grouped on codes too
+    results = results.astype({column: "category" for column in results.columns if results[column].dtype == object})
+    combinations = results.value_counts(dropna=False)
+
+    for combination, count in zip(combinations.index.tolist(), combinations.tolist(), strict=True):
+        # Literal prefix checks; str.contains would read "[WARN]" as a regex character class
+        status, severity, assignee = (str(result) for result in combination)
+        if status == STATUS_BOTH_CLOSED:
+            counts["both_closed"] += count
+        elif status == STATUS_BOTH_OPEN:
+            counts["both_open"] += count
+        for column, result in (("status", status), ("severity", severity), ("assignee", assignee)):
+            if result.startswith(OK_PREFIX):
+                counts[f"{column}_matches"] += count
+            elif result.startswith(WARN_PREFIX):
+                counts[f"{column}_mismatches"] += count
+        if status.startswith(OK_PREFIX) and severity.startswith(OK_PREFIX) and assignee.startswith(OK_PREFIX):
+            counts["perfect_matches"] += count
+
+    return counts
+
+
+def _summary_counts(df: pd.DataFrame) -> dict[str, int]:
+    """Count summary metrics with one grouped count over the comparison columns.
+
+    Args:
+        df: Full traceability DataFrame
+
+    Returns:
+        Dictionary of metric name to count
+    """
+    linked = _linked_mask(df)
+    linked_issues = int(linked.sum())
+
+    # Only linked items are compared; a few distinct result combinations cover every linked row
+    return {
+        "total": len(df),
+        "linked": linked_issues,
+        "unlinked": len(df) - linked_issues,
+        **comparison_counts(df.loc[linked, list(_COMPARISON_COLUMNS)]),
+    }
+
 
 def generate_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
     """Generate summary statistics from traceability DataFrame.
@@ -12,18 +103,7 @@ def generate_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with summary statistics
     """
-    total_issues = len(df)
-    linked_issues = len(df[df["ADO ID"] != "Not Linked"])
-    unlinked_issues = total_issues - linked_issues
-
-    # Only count mismatches among linked items
-    df_linked = df[df["ADO ID"] != "Not Linked"]
-    status_mismatches = len(df_linked[df_linked["Status Comparison"].str.contains("[WARN]", na=False)])
-    severity_mismatches = len(df_linked[df_linked["Severity Comparison"].str.contains("[WARN]", na=False)])
-    assignee_mismatches = len(df_linked[df_linked["Assignee Match"].str.contains("[WARN]", na=False)])
-
-    both_closed = len(df_linked[df_linked["Status Comparison"] == "[OK] Both Closed"])
-    both_open = len(df_linked[df_linked["Status Comparison"] == "[OK] Both Open"])
+    counts = _summary_counts(df)
 
     summary_stats = {
         "Metric": [
@@ -32,64 +112,62 @@ def generate_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
             "Not Linked to ADO",
             "Both Closed",
             "Both Open",
+            "Perfect Matches",
             "Status Mismatches",
             "Severity Mismatches",
             "Assignee Mismatches",
         ],
         "Count": [
-            total_issues,
-            linked_issues,
-            unlinked_issues,
-            both_closed,
-            both_open,
-            status_mismatches,
-            severity_mismatches,
-            assignee_mismatches,
+            counts["total"],
+            counts["linked"],
+            counts["unlinked"],
+            counts["both_closed"],
+            counts["both_open"],
+            counts["perfect_matches"],
+            counts["status_mismatches"],
+            counts["severity_mismatches"],
+            counts["assignee_mismatches"],
         ],
     }
 
     return pd.DataFrame(summary_stats)
 
 
+def summary_to_dict(summary_df: pd.DataFrame) -> dict[str, int]:
+    """Index summary statistics by metric name.
+
+    Args:
+        summary_df: DataFrame from generate_summary_statistics
+
+    Returns:
+        Dictionary mapping each metric to its count
+    """
+    return dict(zip(summary_df["Metric"].tolist(), summary_df["Count"].tolist(), strict=True))
+
+
 def print_summary(
-    df: pd.DataFrame,
+    summary: Mapping[str, int],
     fuzzy_matches_count: int,
     output_file: str,
 ) -> None:
     """Print summary to console.
 
     Args:
-        df: Full traceability DataFrame
+        summary: Count per metric, as produced by summary_to_dict
         fuzzy_matches_count: Number of fuzzy matches found
         output_file: Output file path
     """
-    total_issues = len(df)
-    linked_issues = len(df[df["ADO ID"] != "Not Linked"])
-    unlinked_issues = total_issues - linked_issues
-
-    # Only count mismatches among linked items
-    df_linked = df[df["ADO ID"] != "Not Linked"]
-    status_mismatches = len(df_linked[df_linked["Status Comparison"].str.contains("[WARN]", na=False)])
-    severity_mismatches = len(df_linked[df_linked["Severity Comparison"].str.contains("[WARN]", na=False)])
-    assignee_mismatches = len(df_linked[df_linked["Assignee Match"].str.contains("[WARN]", na=False)])
-
-    # Calculate perfect matches
-    df_matched = df[df["ADO ID"] != "Not Linked"]
-    perfect_matches = len(
-        df_matched[
-            (df_matched["Status Comparison"].str.contains("[OK]", na=False))
-            & (df_matched["Severity Comparison"].str.contains("[OK]", na=False))
-            & (df_matched["Assignee Match"].str.contains("[OK]", na=False))
-        ]
-    )
-
-    print(f"\n[SUCCESS] Report generated successfully: {output_file}")
-    print("\nSummary:")
-    print(f"  Total Issues: {total_issues}")
-    print(f"  Linked to ADO: {linked_issues}")
-    print(f"  Not Linked: {unlinked_issues}")
-    print(f"  Potential Matches Found (Fuzzy): {fuzzy_matches_count}")
-    print(f"  Perfect Matches (Status+Severity+Assignee): {perfect_matches}")
-    print(f"  Status Mismatches (among linked): {status_mismatches}")
-    print(f"  Severity Mismatches (among linked): {severity_mismatches}")
-    print(f"  Assignee Mismatches (among linked): {assignee_mismatches}")
+    lines = [
+        f"\n[SUCCESS] Report generated successfully: {output_file}",
+        "\nSummary:",
+        f"  Total Issues: {summary['Total Jira Issues']}",
+        f"  Linked to ADO: {summary['Linked to ADO']}",
+        f"  Not Linked: {summary['Not Linked to ADO']}",
+        f"  Potential Matches Found (Fuzzy): {fuzzy_matches_count}",
+        f"  Perfect Matches (Status+Severity+Assignee): {summary['Perfect Matches']}",
+        f"  Status Mismatches (among linked): {summary['Status Mismatches']}",
+        f"  Severity Mismatches (among linked): {summary['Severity Mismatches']}",
+        f"  Assignee Mismatches (among linked): {summary['Assignee Mismatches']}",
+    ]
+    # One write for the whole block instead of a locked write per line
+    sys.stdout.write("\n".join(lines) + "\n")
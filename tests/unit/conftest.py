@@ -0,0 +1,77 @@
+"""Shared fixtures for unit tests."""
+
+from pathlib import Path
+
+import pytest
+
+# Every environment variable the config loaders read
+_CONFIG_ENV_VARS = (
+    "ADO_SERVER",
+    "ADO_COLLECTION",
+    "ADO_PROJECT",
+    "ADO_PAT",
+    "JIRA_URL",
+    "JIRA_USERNAME",
+    "JIRA_API_TOKEN",
+    "JIRA_PROJECT_KEY",
+    "JIRA_JQL",
+    "JIRA_INPUT_FILE",
+    "OUTPUT_FILE",
+    "DATA_SOURCE",
+)
+
+
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Unset every config environment variable for the duration of a test."""
+    for name in _CONFIG_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def base_env(clean_env: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Set a complete FILE-mode environment; tests adjust only the variables they exercise."""
+    clean_env.setenv("ADO_SERVER", "https://dev.azure.com")
+    clean_env.setenv("ADO_COLLECTION", "TestCollection")
+    clean_env.setenv("ADO_PROJECT", "TestProject")
+    clean_env.setenv("ADO_PAT", "test-pat")
+    clean_env.setenv("JIRA_INPUT_FILE", "test_jira.json")
+    clean_env.setenv("OUTPUT_FILE", "test_output.xlsx")
+    clean_env.setenv("DATA_SOURCE", "FILE")
+    return clean_env
+
+
+@pytest.fixture(scope="session")
+def valid_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a config file setting every option once per session; tests must not modify it."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.json"
+    config_file.write_text(
+        """{
+            "ado_server": "https://dev.azure.com",
+            "ado_collection": "MyCollection",
+            "ado_project": "MyProject",
+            "ado_pat": "test-pat-token",
+            "jira_data_file": "jira_data.json",
+            "output_file": "output.xlsx",
+            "fuzzy_match_threshold": 80,
+            "fuzzy_match_limit": 10,
+            "ado_scan_days": 60
+        }"""
+    )
+    return config_file
+
+
+@pytest.fixture(scope="session")
+def minimal_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write a config file with only the required ADO settings once per session; tests must not modify it."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.json"
+    config_file.write_text(
+        """{
+            "ado_server": "https://dev.azure.com",
+            "ado_collection": "MyCollection",
+            "ado_project": "MyProject",
+            "ado_pat": "file-pat-token"
+        }"""
+    )
+    return config_file
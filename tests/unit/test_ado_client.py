@@ -1,5 +1,6 @@
 """Unit tests for ado_client module."""
 
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -66,11 +67,11 @@ class TestFetchWorkItem:
             result = ado_client.fetch_work_item("12345")
 
         assert result is not None
-        assert result["id"] == "12345"
-        assert result["title"] == "Test Work Item"
-        assert result["state"] == "Active"
-        assert result["assigned_to"] == "Jane Doe"
-        assert result["work_item_type"] == "Bug"
+        assert result.id == "12345"
+        assert result.title == "Test Work Item"
+        assert result.state == "Active"
+        assert result.assigned_to == "Jane Doe"
+        assert result.work_item_type == "Bug"
 
     def test_fetch_with_string_assigned_to(self, ado_client: AdoClient) -> None:
         """Test fetching work item with assigned_to as string."""
@@ -90,7 +91,7 @@ class TestFetchWorkItem:
             result = ado_client.fetch_work_item("12345")
 
         assert result is not None
-        assert result["assigned_to"] == "John Doe"
+        assert result.assigned_to == "John Doe"
 
     def test_fetch_http_error(self, ado_client: AdoClient) -> None:
         """Test handling HTTP error."""
@@ -110,43 +111,90 @@ class TestFetchWorkItem:
         assert result is None
 
 
+def _batch_response(work_items: list[dict[str, Any] | None]) -> Mock:
+    """Create a mock workitemsbatch response."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"count": len(work_items), "value": work_items}
+    return mock_response
+
+
 class TestFetchWorkItems:
     """Tests for fetch_work_items method."""
 
     def test_fetch_multiple_items(self, ado_client: AdoClient) -> None:
         """Test fetching multiple work items."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 1,
-            "fields": {
-                "System.Title": "Item",
-                "System.State": "Active",
-                "System.WorkItemType": "Task",
-            },
-        }
+        fields = {"System.Title": "Item", "System.State": "Active", "System.WorkItemType": "Task"}
+        mock_response = _batch_response([{"id": 123, "fields": fields}, {"id": 456, "fields": fields}])
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.post", return_value=mock_response) as mock_post:
             result = ado_client.fetch_work_items(["123", "456"])
 
         assert len(result) == 2
         assert "123" in result
         assert "456" in result
+        assert mock_post.call_count == 1
+        assert "/wit/workitemsbatch" in mock_post.call_args.args[0]
+        assert mock_post.call_args.kwargs["json"]["ids"] == [123, 456]
 
     def test_fetch_skips_invalid_ids(self, ado_client: AdoClient) -> None:
         """Test that invalid IDs are skipped."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 123,
-            "fields": {"System.Title": "Valid", "System.State": "Active"},
-        }
+        mock_response = _batch_response([{"id": 123, "fields": {"System.Title": "Valid", "System.State": "Active"}}])
 
-        with patch("requests.get", return_value=mock_response):
-            result = ado_client.fetch_work_items(["123", "", "Not Linked"])
+        with patch("requests.post", return_value=mock_response) as mock_post:
+            result = ado_client.fetch_work_items(["123", "", "Not Linked", "ABC-1"])
 
         assert len(result) == 1
         assert "123" in result
+        assert mock_post.call_args.kwargs["json"]["ids"] == [123]
+
+    def test_fetch_requests_each_id_once(self, ado_client: AdoClient) -> None:
+        """Test that duplicate IDs are only requested once."""
+        mock_response = _batch_response([{"id": 123, "fields": {}}, {"id": 456, "fields": {}}])
+
+        with patch("requests.post", return_value=mock_response) as mock_post:
+            result = ado_client.fetch_work_items(["123", "456", "123"])
+
+        assert list(result) == ["123", "456"]
+        assert mock_post.call_args.kwargs["json"]["ids"] == [123, 456]
+
+    def test_fetch_keys_results_by_requested_id(self, ado_client: AdoClient) -> None:
+        """Test that zero-padded IDs, which ADO echoes back as plain integers, keep their requested key."""
+        mock_response = _batch_response([{"id": 123, "fields": {"System.State": "Active"}}])
+
+        with patch("requests.post", return_value=mock_response) as mock_post:
+            result = ado_client.fetch_work_items(["0123", "123"])
+
+        assert list(result) == ["0123", "123"]
+        assert result["0123"].state == "Active"
+        assert mock_post.call_args.kwargs["json"]["ids"] == [123]
+
+    def test_fetch_skips_missing_items(self, ado_client: AdoClient) -> None:
+        """Test that items omitted by the batch API (null entries) are skipped."""
+        mock_response = _batch_response([{"id": 123, "fields": {}}, None])
+
+        with patch("requests.post", return_value=mock_response):
+            result = ado_client.fetch_work_items(["123", "999"])
+
+        assert list(result) == ["123"]
+
+    def test_fetch_splits_into_batches_of_200(self, ado_client: AdoClient) -> None:
+        """Test that more than 200 IDs are fetched in several batch requests."""
+        with patch("requests.post", return_value=_batch_response([])) as mock_post:
+            ado_client.fetch_work_items([str(i) for i in range(1, 451)])
+
+        batch_sizes = sorted(len(call.kwargs["json"]["ids"]) for call in mock_post.call_args_list)
+        assert batch_sizes == [50, 200, 200]
+
+    def test_fetch_http_error(self, ado_client: AdoClient) -> None:
+        """Test that a failed batch request returns no items."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+
+        with patch("requests.post", return_value=mock_response):
+            result = ado_client.fetch_work_items(["123"])
+
+        assert result == {}
 
 
 class TestQueryRecentWorkItems:
@@ -159,21 +207,11 @@ class TestQueryRecentWorkItems:
         mock_wiql_response.status_code = 200
         mock_wiql_response.json.return_value = {"workItems": [{"id": 1}, {"id": 2}]}
 
-        # Mock individual work item fetches
-        mock_item_response = Mock()
-        mock_item_response.status_code = 200
-        mock_item_response.json.return_value = {
-            "fields": {
-                "System.Title": "Test Item",
-                "System.State": "Active",
-                "System.WorkItemType": "Bug",
-            }
-        }
+        # Mock batch work item fetch
+        fields = {"System.Title": "Test Item", "System.State": "Active", "System.WorkItemType": "Bug"}
+        mock_batch_response = _batch_response([{"id": 1, "fields": fields}, {"id": 2, "fields": fields}])
 
-        with (
-            patch("requests.post", return_value=mock_wiql_response),
-            patch("requests.get", return_value=mock_item_response),
-        ):
+        with patch("requests.post", side_effect=[mock_wiql_response, mock_batch_response]):
             result = ado_client.query_recent_work_items(days=30)
 
         assert len(result) == 2
@@ -210,20 +248,11 @@ class TestQueryRecentWorkItems:
         mock_wiql_response.status_code = 200
         mock_wiql_response.json.return_value = {"workItems": work_items}
 
-        mock_item_response = Mock()
-        mock_item_response.status_code = 200
-        mock_item_response.json.return_value = {
-            "fields": {
-                "System.Title": "Item",
-                "System.State": "Active",
-                "System.WorkItemType": "Task",
-            }
-        }
+        fields = {"System.Title": "Item", "System.State": "Active", "System.WorkItemType": "Task"}
+        mock_batch_response = _batch_response([{"id": i, "fields": fields} for i in range(200)])
 
-        with (
-            patch("requests.post", return_value=mock_wiql_response),
-            patch("requests.get", return_value=mock_item_response),
-        ):
+        with patch("requests.post", side_effect=[mock_wiql_response, mock_batch_response]) as mock_post:
             result = ado_client.query_recent_work_items(days=90)
 
         assert len(result) == 200  # Limited to 200
+        assert len(mock_post.call_args.kwargs["json"]["ids"]) == 200
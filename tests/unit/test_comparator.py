@@ -105,7 +105,7 @@ class TestAddComparisonColumns:
         assert "Status Comparison" in result.columns
         assert "Severity Comparison" in result.columns
         assert "Assignee Match" in result.columns
-        assert result.iloc[0]["ADO State"] == "Closed"
+        assert result["ADO State"].iat[0] == "Closed"
 
     def test_add_comparison_columns_unlinked(self) -> None:
         """Test with unlinked Jira items."""
@@ -124,7 +124,9 @@ class TestAddComparisonColumns:
         result = add_comparison_columns(df, ado_work_items)
 
         assert "Status Comparison" in result.columns
-        assert result.iloc[0]["Status Comparison"] == "No ADO Link"
+        assert result["Status Comparison"].iat[0] == "No ADO Link"
+        assert isinstance(result["Status Comparison"].dtype, pd.CategoricalDtype)
+        assert isinstance(result["Assignee Match"].dtype, pd.CategoricalDtype)
 
     def test_add_comparison_columns_multiple_items(self) -> None:
         """Test with multiple Jira items."""
@@ -158,5 +160,16 @@ class TestAddComparisonColumns:
         result = add_comparison_columns(df, ado_work_items)
 
         assert len(result) == 2
-        assert result.iloc[0]["ADO State"] == "Closed"
-        assert result.iloc[1]["ADO State"] == ""  # Unlinked
+        assert result["ADO State"].iat[0] == "Closed"
+        assert result["ADO State"].iat[1] == ""  # Unlinked
+        assert result["Status Comparison"].tolist() == ["[OK] Both Closed", "No ADO Link"]
+        assert result["Severity Comparison"].tolist() == ["[OK] Match", "N/A"]
+
+    def test_add_comparison_columns_empty(self) -> None:
+        """Test with an empty Jira DataFrame."""
+        df = pd.DataFrame(columns=["Jira Key", "ADO ID", "Jira Status Category", "Jira Severity", "Jira Assignee"])
+
+        result = add_comparison_columns(df, {})
+
+        assert result.empty
+        assert "Assignee Match" in result.columns
@@ -55,9 +55,9 @@ class TestFindFuzzyMatches:
         matches = find_fuzzy_matches(unlinked_df, ado_work_items, threshold=70, limit=5)
 
         assert len(matches) > 0
-        assert matches[0]["jira_key"] == "PROJ-1"
-        assert matches[0]["potential_ado_id"] == "101"
-        assert matches[0]["match_score"] >= 70
+        assert matches[0].jira_key == "PROJ-1"
+        assert matches[0].potential_ado_id == "101"
+        assert matches[0].match_score >= 70
 
     def test_find_matches_with_high_threshold(self) -> None:
         """Test that low similarity doesn't match with high threshold."""
@@ -134,6 +134,26 @@ class TestFindFuzzyMatches:
         # Should have at most 3 matches (limit)
         assert len(matches) <= 3
 
+    def test_limit_keeps_earliest_of_tied_scores(self) -> None:
+        """Test that equally scored items beyond the limit are dropped in ADO order."""
+        unlinked_df = pd.DataFrame(
+            {
+                "Jira Key": ["PROJ-1"],
+                "Jira Summary": ["Test issue"],
+                "Jira Status": ["Open"],
+            }
+        )
+
+        titles = ["Test issue 11", "Test issue 12", "Test issue", "Test issue 13", "Test issue 14"]
+        ado_work_items = [
+            {"id": str(101 + i), "title": title, "state": "Active", "work_item_type": "Task"}
+            for i, title in enumerate(titles)
+        ]
+
+        matches = find_fuzzy_matches(unlinked_df, ado_work_items, threshold=50, limit=3)
+
+        assert [match.potential_ado_id for match in matches] == ["103", "101", "102"]
+
     def test_find_matches_multiple_jira_issues(self) -> None:
         """Test matching multiple Jira issues."""
         unlinked_df = pd.DataFrame(
@@ -162,7 +182,7 @@ class TestFindFuzzyMatches:
         matches = find_fuzzy_matches(unlinked_df, ado_work_items, threshold=70, limit=5)
 
         # Should find matches for both Jira issues
-        jira_keys = {match["jira_key"] for match in matches}
+        jira_keys = {match.jira_key for match in matches}
         assert "PROJ-1" in jira_keys or "PROJ-2" in jira_keys
 
     def test_match_confidence_levels(self) -> None:
@@ -188,4 +208,62 @@ class TestFindFuzzyMatches:
 
         if matches:
             # Exact match should have Very High confidence
-            assert matches[0]["confidence"] in ["Very High", "High", "Medium"]
+            assert matches[0].confidence in ["Very High", "High", "Medium"]
+
+    def test_matches_ordered_by_score_with_confidence(self) -> None:
+        """Test that matches are ordered by score and bucketed into confidence levels."""
+        unlinked_df = pd.DataFrame(
+            {
+                "Jira Key": ["PROJ-1"],
+                "Jira Summary": ["Fix login bug"],
+                "Jira Status": ["Open"],
+            }
+        )
+
+        ado_work_items = [
+            {"id": "101", "title": "Fix login bugs", "state": "Active", "work_item_type": "Bug"},
+            {"id": "102", "title": "fix LOGIN bug", "state": "Closed", "work_item_type": "Bug"},
+        ]
+
+        matches = find_fuzzy_matches(unlinked_df, ado_work_items, threshold=70, limit=5)
+
+        assert [match.potential_ado_id for match in matches] == ["102", "101"]
+        assert matches[0].match_score == 100
+        assert matches[0].confidence == "Very High"
+        assert matches[0].ado_state == "Closed"
+
+    def test_score_rounding_up_to_threshold_is_kept(self) -> None:
+        """Test that a raw similarity just under the threshold still matches once rounded up to it."""
+        unlinked_df = pd.DataFrame(
+            {
+                "Jira Key": ["PROJ-1"],
+                "Jira Summary": ["login export"],  # 69.6% similar to "page export"
+                "Jira Status": ["Open"],
+            }
+        )
+
+        ado_work_items = [{"id": "101", "title": "page export", "state": "Active", "work_item_type": "Bug"}]
+
+        matches = find_fuzzy_matches(unlinked_df, ado_work_items, threshold=70, limit=5)
+
+        assert len(matches) == 1
+        assert matches[0].match_score == 70
+
+    def test_titles_sharing_only_stop_words_are_not_scored(self) -> None:
+        """Test that ADO titles sharing no meaningful word with the summary are skipped."""
+        unlinked_df = pd.DataFrame(
+            {
+                "Jira Key": ["PROJ-1"],
+                "Jira Summary": ["Fix the lag"],
+                "Jira Status": ["Open"],
+            }
+        )
+
+        ado_work_items = [
+            {"id": "101", "title": "Fax the log", "state": "Active", "work_item_type": "Bug"},
+            {"id": "102", "title": "Fix lag", "state": "Active", "work_item_type": "Bug"},
+        ]
+
+        matches = find_fuzzy_matches(unlinked_df, ado_work_items, threshold=50, limit=5)
+
+        assert [match.potential_ado_id for match in matches] == ["102"]
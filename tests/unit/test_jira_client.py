@@ -0,0 +1,88 @@
+"""Unit tests for jira_client module."""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from jira_ado_traceability.jira_client import JiraClient
+from jira_ado_traceability.models import Config
+
+
+@pytest.fixture
+def jira_client() -> JiraClient:
+    """Create Jira client with test config."""
+    config = Config(
+        ado_server="https://dev.azure.com",
+        ado_collection="TestCollection",
+        ado_project="TestProject",
+        ado_pat="test-pat-token",
+        jira_url="https://example.atlassian.net",
+        jira_username="user@example.com",
+        jira_jql="project = TEST",
+        data_source="API",
+    )
+    return JiraClient(config)
+
+
+def _response(status_code: int, body: dict[str, Any]) -> Mock:
+    """Create a mock HTTP response."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body
+    return mock_response
+
+
+def _route(myself: Mock, search: Callable[[int], Mock]) -> Callable[..., Mock]:
+    """Dispatch mocked GETs by endpoint; the auth check and first page run on separate threads."""
+
+    def get(url: str, **kwargs: Any) -> Mock:
+        if url.endswith("/myself"):
+            return myself
+        return search(kwargs["params"]["startAt"])
+
+    return get
+
+
+class TestConnectAndSearch:
+    """Tests for connect_and_search method."""
+
+    def test_failed_connection_raises(self, jira_client: JiraClient) -> None:
+        """Test that a failed /myself check raises ConnectionError."""
+        get = _route(_response(401, {}), lambda _: _response(200, {"issues": [], "total": 0}))
+
+        with patch("requests.get", side_effect=get), pytest.raises(ConnectionError, match="Failed to connect"):
+            jira_client.connect_and_search()
+
+    def test_first_page_is_reused(self, jira_client: JiraClient) -> None:
+        """Test that pagination continues from the in-flight first page instead of requesting it again."""
+        pages = {
+            0: _response(200, {"issues": [{"key": f"TEST-{i}"} for i in range(100)], "total": 150}),
+            100: _response(200, {"issues": [{"key": f"TEST-{i}"} for i in range(100, 150)], "total": 150}),
+        }
+        get = _route(_response(200, {"displayName": "Test User"}), pages.__getitem__)
+
+        with patch("requests.get", side_effect=get) as mock_get:
+            result = jira_client.connect_and_search(max_results=1000)
+
+        start_ats = [c.kwargs["params"]["startAt"] for c in mock_get.call_args_list if "params" in c.kwargs]
+        assert sorted(start_ats) == [0, 100]
+        assert result["total"] == 150
+        assert result["issues"][0]["key"] == "TEST-0"
+
+    def test_first_page_request_error_is_handled(self, jira_client: JiraClient) -> None:
+        """Test that a request error raised by the first-page future ends the search without raising."""
+
+        def search(_: int) -> Mock:
+            raise requests.ConnectionError("connection reset")
+
+        get = _route(_response(200, {"displayName": "Test User"}), search)
+
+        with patch("requests.get", side_effect=get) as mock_get:
+            result = jira_client.connect_and_search()
+
+        assert result["issues"] == []
+        assert result["total"] == 0
+        assert mock_get.call_count == 2  # auth check and the single failed first page
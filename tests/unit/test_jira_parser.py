@@ -2,10 +2,12 @@
 
 import json
 from pathlib import Path
+from unittest.mock import Mock
 
 import pandas as pd
 import pytest
 
+from jira_ado_traceability import jira_parser
 from jira_ado_traceability.jira_parser import (
     load_and_parse_jira_issues,
     load_jira_data,
@@ -41,6 +43,23 @@ class TestLoadJiraData:
         with pytest.raises(json.JSONDecodeError):
             load_jira_data(test_file)
 
+    def test_load_large_file_memory_mapped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that files at or above the large-export threshold load the same data via mmap."""
+        monkeypatch.setattr(jira_parser, "_LARGE_EXPORT_BYTES", 1)
+        test_file = tmp_path / "large.json"
+        test_data = {"issues": [{"key": "TEST-1", "fields": {"summary": "Mapped"}}]}
+        test_file.write_text(json.dumps(test_data))
+
+        assert load_jira_data(test_file) == test_data
+
+    def test_load_empty_file(self, tmp_path: Path) -> None:
+        """Test loading an empty file raises a decode error rather than an mmap error."""
+        test_file = tmp_path / "empty.json"
+        test_file.write_bytes(b"")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_jira_data(test_file)
+
 
 class TestParseJiraIssue:
     """Tests for parse_jira_issue function."""
@@ -168,8 +187,59 @@ class TestParseJiraIssues:
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 2
-        assert df.iloc[0]["Jira Key"] == "PROJ-1"
-        assert df.iloc[1]["Jira Key"] == "PROJ-2"
+        assert df["Jira Key"].iat[0] == "PROJ-1"
+        assert df["Jira Key"].iat[1] == "PROJ-2"
+
+    def test_parse_issues_fills_missing_fields(self) -> None:
+        """Test that missing and null fields get the same defaults as single-issue parsing."""
+        jira_data = {
+            "issues": [
+                {
+                    "key": "PROJ-1",
+                    "fields": {
+                        "summary": "Complete",
+                        "status": {"name": "Done", "statusCategory": {"name": "Done"}},
+                        "priority": {"name": "High"},
+                        "assignee": {"displayName": "John Doe"},
+                        "created": "2024-01-15T10:00:00.000+0000",
+                        "customfield_10109": "12345",
+                    },
+                },
+                {
+                    "key": "PROJ-2",
+                    "fields": {
+                        "summary": "Sparse",
+                        "status": {"name": "Open"},
+                        "priority": None,
+                        "assignee": None,
+                        "customfield_10109": "",
+                    },
+                },
+            ]
+        }
+
+        df = parse_jira_issues(jira_data)
+
+        sparse = df.iloc[1]
+        assert sparse["Jira Status Category"] == "Unknown"
+        assert sparse["Jira Priority"] == "None"
+        assert sparse["Jira Severity"] == "None"
+        assert sparse["Jira Assignee"] == "Unassigned"
+        assert sparse["ADO ID"] == "Not Linked"
+        assert sparse["ADO State (Jira)"] == "N/A"
+        assert pd.isna(sparse["Jira Created"])
+        assert df["Jira Created"].iat[0] == pd.Timestamp("2024-01-15 10:00:00")
+        assert df["ADO ID"].iat[0] == "12345"
+        assert isinstance(df["Jira Summary"].dtype, pd.StringDtype)
+
+    def test_parse_issues_without_date_parsing(self) -> None:
+        """Test that dates stay as raw strings when date parsing is skipped."""
+        jira_data = {"issues": [{"key": "TEST-1", "fields": {"created": "2024-01-15T10:00:00.000+0000"}}]}
+
+        df = parse_jira_issues(jira_data, parse_dates=False)
+
+        assert df["Jira Created"].iat[0] == "2024-01-15T10:00:00.000+0000"
+        assert df["Jira Resolved"].iat[0] is None
 
     def test_parse_empty_issues(self) -> None:
         """Test parsing empty issues list."""
@@ -205,6 +275,67 @@ class TestLoadAndParseJiraIssues:
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 1
-        assert df.iloc[0]["Jira Key"] == "TEST-1"
-        assert df.iloc[0]["Jira Summary"] == "Test Issue"
-        assert df.iloc[0]["Jira Priority"] == "Medium"
+        assert df["Jira Key"].iat[0] == "TEST-1"
+        assert df["Jira Summary"].iat[0] == "Test Issue"
+        assert df["Jira Priority"].iat[0] == "Medium"
+
+    def test_load_and_parse_large_file_streamed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that streaming a large file in batches gives the same DataFrame as parsing it in memory."""
+        test_file = tmp_path / "jira.json"
+        issues = [
+            {
+                "key": f"TEST-{i}",
+                "fields": {
+                    "summary": f"Issue {i}",
+                    "status": {"name": "Done", "statusCategory": {"name": "Done"}},
+                    "assignee": None if i % 2 else {"displayName": "Jane"},
+                    "created": "2024-01-15T10:00:00.000+0000",
+                    "customfield_10109": str(100 + i) if i % 3 else None,
+                },
+            }
+            for i in range(5)
+        ]
+        test_file.write_text(json.dumps({"issues": issues}))
+        expected = load_and_parse_jira_issues(test_file)
+
+        monkeypatch.setattr(jira_parser, "_LARGE_EXPORT_BYTES", 1)
+        monkeypatch.setattr(jira_parser, "_STREAM_BATCH_SIZE", 2)
+        df = load_and_parse_jira_issues(test_file)
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_load_and_parse_large_file_without_issues(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that streaming a file with no issues gives an empty DataFrame with all columns."""
+        test_file = tmp_path / "jira.json"
+        test_file.write_text('{"issues": []}')
+        monkeypatch.setattr(jira_parser, "_LARGE_EXPORT_BYTES", 1)
+
+        df = load_and_parse_jira_issues(test_file)
+
+        assert len(df) == 0
+        assert "Jira Key" in df.columns
+
+    def test_load_and_parse_large_invalid_json(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that invalid JSON raises the same error when streamed."""
+        test_file = tmp_path / "invalid.json"
+        test_file.write_text('{"issues": [{"key": }')
+        monkeypatch.setattr(jira_parser, "_LARGE_EXPORT_BYTES", 1)
+
+        with pytest.raises(json.JSONDecodeError):
+            load_and_parse_jira_issues(test_file)
+
+    @pytest.mark.parametrize(("threshold_offset", "streamed"), [(0, True), (1, False)])
+    def test_load_and_parse_streams_from_large_export_threshold(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold_offset: int, streamed: bool
+    ) -> None:
+        """Test that files of exactly the large-export size are streamed and smaller ones are not."""
+        test_file = tmp_path / "jira.json"
+        test_file.write_text('{"issues": [{"key": "TEST-1", "fields": {}}]}')
+        monkeypatch.setattr(jira_parser, "_LARGE_EXPORT_BYTES", test_file.stat().st_size + threshold_offset)
+        stream = Mock(wraps=jira_parser._stream_and_parse_jira_issues)
+        monkeypatch.setattr(jira_parser, "_stream_and_parse_jira_issues", stream)
+
+        df = load_and_parse_jira_issues(test_file)
+
+        assert stream.called is streamed
+        assert df["Jira Key"].tolist() == ["TEST-1"]
@@ -6,8 +6,25 @@ from unittest.mock import patch
 import pandas as pd
 
 from jira_ado_traceability.reporter import (
+    comparison_counts,
     generate_summary_statistics,
     print_summary,
+    summary_to_dict,
+)
+
+_ZERO_SUMMARY = dict.fromkeys(
+    (
+        "Total Jira Issues",
+        "Linked to ADO",
+        "Not Linked to ADO",
+        "Both Closed",
+        "Both Open",
+        "Perfect Matches",
+        "Status Mismatches",
+        "Severity Mismatches",
+        "Assignee Mismatches",
+    ),
+    0,
 )
 
 
@@ -45,12 +62,9 @@ class TestGenerateSummaryStatistics:
             }
         )
 
-        summary = generate_summary_statistics(df)
+        counts = summary_to_dict(generate_summary_statistics(df))
 
-        # Find the row for linked items
-        linked_row = summary[summary["Metric"] == "Linked to ADO"]
-        assert len(linked_row) > 0
-        assert linked_row.iloc[0]["Count"] == 2
+        assert counts["Linked to ADO"] == 2
 
     def test_summary_counts_unlinked_items(self) -> None:
         """Test that unlinked items are counted correctly."""
@@ -64,12 +78,9 @@ class TestGenerateSummaryStatistics:
             }
         )
 
-        summary = generate_summary_statistics(df)
+        counts = summary_to_dict(generate_summary_statistics(df))
 
-        # Find the row for unlinked items
-        unlinked_row = summary[summary["Metric"] == "Not Linked to ADO"]
-        assert len(unlinked_row) > 0
-        assert unlinked_row.iloc[0]["Count"] == 2
+        assert counts["Not Linked to ADO"] == 2
 
     def test_summary_with_empty_dataframe(self) -> None:
         """Test summary generation with empty DataFrame."""
@@ -105,68 +116,115 @@ class TestGenerateSummaryStatistics:
             }
         )
 
-        summary = generate_summary_statistics(df)
+        counts = summary_to_dict(generate_summary_statistics(df))
 
-        # Find status match metrics
-        status_ok_row = summary[summary["Metric"].str.contains("Status.*OK", na=False)]
-        if len(status_ok_row) > 0:
-            assert status_ok_row.iloc[0]["Count"] == 2
+        assert counts["Both Closed"] == 1
+        assert counts["Both Open"] == 1
+        assert counts["Status Mismatches"] == 1
 
+    def test_summary_mismatches_require_warn_prefix(self) -> None:
+        """Test that results merely containing W, A, R or N are not counted as mismatches."""
+        df = pd.DataFrame(
+            {
+                "Jira Key": ["J-1", "J-2"],
+                "ADO ID": ["A-1", "A-2"],
+                "Status Comparison": ["No ADO Link", "[WARN] Jira Closed, ADO Open"],
+                "Severity Comparison": ["N/A", "[OK] Match"],
+                "Assignee Match": ["[OK] Match", "[OK] Match"],
+            }
+        )
 
-class TestPrintSummary:
-    """Tests for print_summary function."""
+        counts = summary_to_dict(generate_summary_statistics(df))
 
-    def test_print_summary_output(self) -> None:
-        """Test that print_summary produces output."""
+        assert counts["Status Mismatches"] == 1
+        assert counts["Severity Mismatches"] == 0
+
+    def test_summary_categorical_results_match_strings(self) -> None:
+        """Test that categorical comparison columns give the same counts as plain strings."""
         df = pd.DataFrame(
             {
-                "Jira Key": ["J-1", "J-2"],
-                "ADO ID": ["A-1", "Not Linked"],
-                "Status Comparison": ["[OK] Both Closed", "No ADO Link"],
-                "Severity Comparison": ["[OK] Match", "N/A"],
-                "Assignee Match": ["[OK] Match", "N/A"],
+                "Jira Key": ["J-1", "J-2", "J-3"],
+                "ADO ID": ["A-1", "A-2", "Not Linked"],
+                "Status Comparison": ["[OK] Both Closed", "[WARN] Jira Closed, ADO Open", "No ADO Link"],
+                "Severity Comparison": ["[OK] Match", "[WARN] Mismatch", "N/A"],
+                "Assignee Match": ["[OK] Match", "[OK] Match", "N/A"],
+            }
+        )
+        categorical = df.astype({"Status Comparison": "category", "Assignee Match": "category"})
+
+        pd.testing.assert_frame_equal(generate_summary_statistics(categorical), generate_summary_statistics(df))
+
+
+class TestComparisonCounts:
+    """Tests for comparison_counts function."""
+
+    def test_counts_agree_with_summary(self) -> None:
+        """Test that per-column matches and mismatches agree with the summary statistics."""
+        df = pd.DataFrame(
+            {
+                "Jira Key": ["J-1", "J-2", "J-3"],
+                "ADO ID": ["A-1", "A-2", "A-3"],
+                "Status Comparison": ["[OK] Both Closed", "[OK] Both Open", "[WARN] Jira Closed, ADO Open"],
+                "Severity Comparison": ["[OK] Match", "N/A", "[WARN] Mismatch"],
+                "Assignee Match": ["[OK] Match", "[OK] Match", "[WARN] Different"],
             }
         )
 
+        counts = comparison_counts(df)
+        summary = summary_to_dict(generate_summary_statistics(df))
+
+        assert (counts["status_matches"], counts["status_mismatches"]) == (2, 1)
+        assert (counts["severity_matches"], counts["severity_mismatches"]) == (1, 1)
+        assert (counts["assignee_matches"], counts["assignee_mismatches"]) == (2, 1)
+        assert counts["perfect_matches"] == summary["Perfect Matches"] == 1
+
+
+class TestPrintSummary:
+    """Tests for print_summary function."""
+
+    def test_print_summary_output(self) -> None:
+        """Test that print_summary produces output."""
+        summary = {**_ZERO_SUMMARY, "Total Jira Issues": 2, "Linked to ADO": 1, "Not Linked to ADO": 1}
+
         with patch("sys.stdout", new=StringIO()) as fake_out:
-            print_summary(df, fuzzy_matches_count=5, output_file="test.xlsx")
+            print_summary(summary, fuzzy_matches_count=5, output_file="test.xlsx")
             output = fake_out.getvalue()
 
-        assert "Total Issues" in output
+        assert "Total Issues: 2" in output
+        assert "Potential Matches Found (Fuzzy): 5" in output
         assert "test.xlsx" in output
 
     def test_print_summary_with_no_fuzzy_matches(self) -> None:
         """Test print summary with no fuzzy matches."""
-        df = pd.DataFrame(
-            {
-                "Jira Key": ["J-1"],
-                "ADO ID": ["A-1"],
-                "Status Comparison": ["[OK] Both Closed"],
-                "Severity Comparison": ["[OK] Match"],
-                "Assignee Match": ["[OK] Match"],
-            }
-        )
+        summary = {**_ZERO_SUMMARY, "Total Jira Issues": 1, "Linked to ADO": 1}
 
         with patch("sys.stdout", new=StringIO()) as fake_out:
-            print_summary(df, fuzzy_matches_count=0, output_file="test.xlsx")
+            print_summary(summary, fuzzy_matches_count=0, output_file="test.xlsx")
             output = fake_out.getvalue()
 
-        assert "0" in output or "no" in output.lower()
+        assert "Potential Matches Found (Fuzzy): 0" in output
 
-    def test_print_summary_shows_linked_count(self) -> None:
-        """Test that linked count is shown in summary."""
+    def test_print_summary_shows_generated_counts(self) -> None:
+        """Test that the counts from generate_summary_statistics are printed."""
         df = pd.DataFrame(
             {
                 "Jira Key": ["J-1", "J-2", "J-3"],
                 "ADO ID": ["A-1", "A-2", "Not Linked"],
                 "Status Comparison": ["[OK] Both Closed", "[OK] Both Open", "No ADO Link"],
-                "Severity Comparison": ["[OK] Match", "[OK] Match", "N/A"],
+                "Severity Comparison": ["[OK] Match", "[WARN] Mismatch", "N/A"],
                 "Assignee Match": ["[OK] Match", "[OK] Match", "N/A"],
             }
         )
+        summary_df = generate_summary_statistics(df)
 
         with patch("sys.stdout", new=StringIO()) as fake_out:
-            print_summary(df, fuzzy_matches_count=0, output_file="test.xlsx")
+            print_summary(
+                summary_to_dict(summary_df),
+                fuzzy_matches_count=0,
+                output_file="test.xlsx",
+            )
             output = fake_out.getvalue()
 
-        assert "2" in output  # 2 linked items
+        assert "Linked to ADO: 2" in output
+        assert "Perfect Matches (Status+Severity+Assignee): 1" in output
+        assert "Severity Mismatches (among linked): 1" in output